@@ -3,7 +3,7 @@ from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
-from algorithms.graph.BellmanFord import bellmanFord
+from algorithms.graph.BellmanFord import distances_bellman_ford, CycleNegatifError
 from data.graph_data import graph 
 
 class BellmanFordPage(tk.Frame):
@@ -11,6 +11,7 @@ class BellmanFordPage(tk.Frame):
         super().__init__(parent)
         self.canvas_widget = None
         self.data = data
+        self.cycle = None  # Cycle négatif détecté, s'il y en a un
         self.graph_data = {
             "nodes": [],
             "start": "",
@@ -19,32 +20,16 @@ class BellmanFordPage(tk.Frame):
         self.visualiser_bellman_ford_graphe()
 
     def bellman_ford(self, nodes, graph, source):
-        """Implementation of Bellman-Ford algorithm"""
-        n = len(nodes)
-        src_idx = nodes.index(source)
+        """Distances and predecessors from source using the selected engine"""
+        mode = self.data.get('mode', 'standard') if self.data else 'standard'
+        self.cycle = None
+        try:
+            distances, predecessors = distances_bellman_ford(nodes, graph, source, mode=mode)
+        except CycleNegatifError as e:
+            self.cycle = e.cycle
+            return None, None  # Negative cycle detected
 
-        # Initialize distances and predecessors
-        distances = [float("inf")] * n
-        predecessors = [-1] * n
-        distances[src_idx] = 0
-
-        # Relax all edges |V| - 1 times
-        for _ in range(n - 1):
-            for u in range(n):
-                for v in range(n):
-                    if graph[u][v] != 0:  # There's an edge from u to v
-                        if distances[u] + graph[u][v] < distances[v]:
-                            distances[v] = distances[u] + graph[u][v]
-                            predecessors[v] = u
-
-        # Check for negative-weight cycles
-        for u in range(n):
-            for v in range(n):
-                if graph[u][v] != 0:  # There's an edge from u to v
-                    if distances[u] + graph[u][v] < distances[v]:
-                        return None, None  # Negative cycle detected
-
-        return distances, predecessors
+        return distances, [-1 if p is None else p for p in predecessors]
 
     def reconstruct_path(self, predecessors, end_node):
         """Reconstruct the shortest path from predecessors array"""
@@ -105,12 +90,15 @@ class BellmanFordPage(tk.Frame):
         end_idx = sommets.index(fin)
         has_path = distances and distances[end_idx] != float("inf")
 
-        # Reconstruct shortest path edges
+        # Reconstruct shortest path edges (or the negative cycle edges)
         path_edges = set()
         if has_path:
             path_nodes = self.reconstruct_path(predecessors, fin)
             for i in range(len(path_nodes) - 1):
                 path_edges.add((path_nodes[i], path_nodes[i + 1]))
+        elif self.cycle:
+            for i in range(len(self.cycle) - 1):
+                path_edges.add((self.cycle[i], self.cycle[i + 1]))
 
         for i in range(len(sommets)):
             for j in range(len(sommets)):
@@ -138,7 +126,10 @@ class BellmanFordPage(tk.Frame):
         node_colors = []
         node_labels = {}
         for i, node in enumerate(sommets):
-            if distances[i] == float("inf"):
+            if distances is None:
+                node_labels[node] = node
+                node_colors.append("#ff6b6b" if node in self.cycle else "#adb5bd")
+            elif distances[i] == float("inf"):
                 node_labels[node] = f"{node}\n∞"
                 node_colors.append("#adb5bd")  # Gray for unreachable
             else:
@@ -202,6 +193,8 @@ class BellmanFordPage(tk.Frame):
         title = "Algorithme de Bellman-Ford"
         if has_path:
             title += f"\nDistance de {debut} à {fin}: {distances[end_idx]}"
+        elif self.cycle:
+            title += "\nCycle de poids négatif détecté"
         else:
             title += "\nAucun chemin trouvé ou cycle négatif détecté"
         ax.set_title(title, fontsize=12, fontweight="bold", pad=20)
@@ -258,6 +251,17 @@ class BellmanFordPage(tk.Frame):
             font=("Arial", 9, "bold")
         ).pack(anchor="w", padx=5, pady=2)
 
+        # Negative cycle section
+        if self.cycle:
+            cycle_frame = ttk.LabelFrame(info_frame, text="Cycle négatif")
+            cycle_frame.pack(side=tk.RIGHT, padx=10, fill=tk.X, expand=True)
+            ttk.Label(
+                cycle_frame,
+                text=" → ".join(str(node) for node in self.cycle),
+                font=("Arial", 10, "bold"),
+                foreground="#c92a2a",
+            ).pack(padx=5, pady=5)
+
         # Path info section
         if has_path:
             path_frame = ttk.LabelFrame(info_frame, text="Chemin optimal")
@@ -5,6 +5,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
 from algorithms.graph.Djikstra import djikstra  # Assurez-vous que le chemin d'import est correct
+from algorithms.graph.AStar import a_etoile
 from tkinter import ttk
 
 class DijkstraPage(tk.Frame):
@@ -51,6 +52,10 @@ class DijkstraPage(tk.Frame):
         self.edges = data.get('edges', [])
         self.start = data.get('start', '')
         self.end = data.get('end', '')
+        # Options A* : heuristique ("euclidienne", "haversine" ou fonction) et coordonnées des sommets
+        self.algorithme = data.get('algorithme', 'dijkstra')
+        self.heuristique = data.get('heuristique')
+        self.coordonnees = data.get('coordonnees', {})
         
         # Afficher le graphe
         self.afficher_graphe_depuis_data()
@@ -72,11 +77,18 @@ class DijkstraPage(tk.Frame):
         for i in range(n):
             matrice_adjacence[i][i] = 0
 
-        # Appliquer Dijkstra
+        # Appliquer Dijkstra ou A* (A* renvoie aussi les sommets explorés)
+        explores = set()
         try:
-            chemin = djikstra(self.sommets, matrice_adjacence, self.start, self.end)
+            if self.algorithme == 'astar':
+                chemin, explores = a_etoile(
+                    self.sommets, matrice_adjacence, self.start, self.end,
+                    heuristique=self.heuristique, coordonnees=self.coordonnees, index=sommet_index
+                )
+            else:
+                chemin = djikstra(self.sommets, matrice_adjacence, self.start, self.end, index=sommet_index)
         except Exception as e:
-            print(f"Erreur Dijkstra: {e}")
+            print(f"Erreur {self.algorithme}: {e}")
             chemin = []
 
         # Créer le graphe
@@ -95,10 +107,22 @@ class DijkstraPage(tk.Frame):
         fig.patch.set_facecolor('#f0f0f0')  # Fond clair
         
         # Positionnement des nœuds
-        pos = nx.spring_layout(G, seed=42)  # Positionnement cohérent
+        if self.coordonnees and all(s in self.coordonnees for s in self.sommets):
+            # Graphe géographique : (latitude, longitude) affiché en (x=longitude, y=latitude)
+            if self.heuristique == 'haversine':
+                pos = {s: (self.coordonnees[s][1], self.coordonnees[s][0]) for s in self.sommets}
+            else:
+                pos = {s: self.coordonnees[s] for s in self.sommets}
+        else:
+            pos = nx.spring_layout(G, seed=42)  # Positionnement cohérent
         
-        # Couleurs des nœuds et arêtes
-        node_colors = ["#4a6baf" if chemin and sommet in chemin else "#2c3e50" for sommet in self.sommets]
+        # Couleurs des nœuds et arêtes (sommets explorés par A* en clair)
+        node_colors = [
+            "#4a6baf" if chemin and sommet in chemin
+            else "#9bb1d9" if sommet in explores
+            else "#2c3e50"
+            for sommet in self.sommets
+        ]
         path_edges = [(chemin[i], chemin[i+1]) for i in range(len(chemin)-1)] if len(chemin) > 1 else []
         edge_colors = ["#4a6baf" if (u, v) in path_edges else "#adb5bd" for u, v in G.edges()]
         edge_widths = [3 if (u, v) in path_edges else 1 for u, v in G.edges()]
@@ -152,6 +176,8 @@ class DijkstraPage(tk.Frame):
                 f"Plus court chemin: {' → '.join(chemin)}\n"
                 f"Distance totale: {distance}"
             )
+            if self.algorithme == 'astar':
+                title += f" - Sommets explorés par A*: {len(explores)}/{len(self.sommets)}"
         else:
             title = f"Aucun chemin trouvé entre {self.start} et {self.end}"
         
@@ -4,8 +4,13 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
+from algorithms.graph.DecompositionFlot import decomposer_flot
+from algorithms.graph.FordFulkerson import choisir_moteur, flot_maximum
 
 class FordFulkersonPage(tk.Frame):
+    # Nombre de chemins affichés dans le tableau des principaux chemins
+    NB_CHEMINS = 5
+
     def __init__(self, parent, data):
         super().__init__(parent)
         self.data = data
@@ -20,18 +25,25 @@ class FordFulkersonPage(tk.Frame):
         source = self.data['source']
         sink = self.data['sink']
         
-        # Calcul du flot maximum avec Ford-Fulkerson
-        max_flow, flow_matrix = fordFulkerson(
+        # Calcul du flot maximum avec le moteur choisi ("auto" : selon la densité)
+        moteur = self.data.get('moteur', 'edmonds_karp')
+        if moteur == 'auto':
+            moteur = choisir_moteur(matrice.tolist())
+        self.moteur = moteur
+        # La coupe minimale est lue sur le résiduel du même calcul, sans relancer le flot
+        max_flow, flow_matrix, coupe = flot_maximum(
             sommets, 
             matrice.tolist(),  # Reconversion en liste
             source, 
-            sink
+            sink,
+            moteur=moteur,
+            coupe=True
         )
         
         # Appel de la visualisation complète
-        self.visualize_network(sommets, matrice, flow_matrix, max_flow)
+        self.visualize_network(sommets, matrice, flow_matrix, max_flow, coupe)
 
-    def visualize_network(self, nodes, capacity_matrix, flow_matrix, max_flow):
+    def visualize_network(self, nodes, capacity_matrix, flow_matrix, max_flow, coupe=None):
         """Visualise le réseau avec capacités, flots, légende et tableau de détails"""
         # Nettoyer la frame précédente
         for widget in self.viz_frame.winfo_children():
@@ -44,6 +56,10 @@ class FordFulkersonPage(tk.Frame):
         # Ajouter les arêtes avec capacités et flots
         edge_labels = {}
         edge_colors = []
+        edge_widths = []
+        aretes_coupe = set()
+        if coupe is not None:
+            aretes_coupe = {(u, v) for u, v, _ in coupe["aretes"]}
 
         for i in range(len(nodes)):
             for j in range(len(nodes)):
@@ -55,8 +71,11 @@ class FordFulkersonPage(tk.Frame):
                     # Formatage du label des arêtes
                     edge_labels[(nodes[i], nodes[j])] = f"{flow}/{capacity}"
 
-                    # Codage couleur
-                    if flow == 0:
+                    # Codage couleur (les arêtes de la coupe minimale sont mises en évidence)
+                    edge_widths.append(5 if (nodes[i], nodes[j]) in aretes_coupe else 3)
+                    if (nodes[i], nodes[j]) in aretes_coupe:
+                        edge_colors.append("#7048e8")  # Violet - coupe minimale
+                    elif flow == 0:
                         edge_colors.append("#cccccc")  # Gris - pas de flot
                     elif flow == capacity:
                         edge_colors.append("#ff6b6b")  # Rouge - saturé
@@ -94,7 +113,7 @@ class FordFulkersonPage(tk.Frame):
             pos,
             ax=ax,
             edge_color=edge_colors,
-            width=3,
+            width=edge_widths,
             arrows=True,
             arrowsize=25,
             arrowstyle="->",
@@ -116,7 +135,7 @@ class FordFulkersonPage(tk.Frame):
 
         # Titre
         ax.set_title(
-            f"Réseau de flot - Flot maximum: {max_flow}",
+            f"Réseau de flot - Flot maximum: {max_flow} (moteur: {self.moteur})",
             fontsize=14,
             fontweight="bold",
             pad=20,
@@ -141,6 +160,14 @@ class FordFulkersonPage(tk.Frame):
             foreground="#2b8a3e",
         ).pack(side=tk.LEFT, padx=10)
 
+        if coupe is not None:
+            ttk.Label(
+                info_frame,
+                text=f"Coupe minimale: {coupe['capacite']}  (côté source: {', '.join(map(str, coupe['cote_source']))})",
+                font=("Arial", 11),
+                foreground="#7048e8",
+            ).pack(side=tk.LEFT, padx=10)
+
         # Légende
         legend_frame = ttk.Frame(info_frame)
         legend_frame.pack(side=tk.RIGHT, padx=10)
@@ -149,6 +176,7 @@ class FordFulkersonPage(tk.Frame):
         ttk.Label(legend_frame, text="• Gris: Pas de flot", foreground="#868e96").pack(anchor="w")
         ttk.Label(legend_frame, text="• Vert: Flot partiel", foreground="#51cf66").pack(anchor="w")
         ttk.Label(legend_frame, text="• Rouge: Flot maximal", foreground="#ff6b6b").pack(anchor="w")
+        ttk.Label(legend_frame, text="• Violet: Coupe minimale", foreground="#7048e8").pack(anchor="w")
 
         # Tableau de détails des flots
         details_frame = ttk.Frame(self.viz_frame)
@@ -176,51 +204,20 @@ class FordFulkersonPage(tk.Frame):
         scrollbar.pack(side="right", fill="y")
         tree.pack(fill=tk.BOTH, expand=True)
 
-
-# Algorithme Ford-Fulkerson (à conserver dans un fichier séparé ou dans le même)
-def fordFulkerson(nodes, capacity_matrix, source, sink):
-    """Implémentation de l'algorithme Ford-Fulkerson avec BFS (Edmonds-Karp)"""
-    n = len(nodes)
-    source_idx = nodes.index(source)
-    sink_idx = nodes.index(sink)
-
-    flow_matrix = [[0] * n for _ in range(n)]
-    residual_graph = [[capacity_matrix[i][j] for j in range(n)] for i in range(n)]
-    parent = [-1] * n
-    max_flow = 0
-
-    def bfs(res_graph, s, t, parent):
-        visited = [False] * n
-        queue = [s]
-        visited[s] = True
-
-        while queue:
-            u = queue.pop(0)
-            for v in range(n):
-                if not visited[v] and res_graph[u][v] > 0:
-                    visited[v] = True
-                    parent[v] = u
-                    queue.append(v)
-                    if v == t:
-                        return True
-        return False
-
-    while bfs(residual_graph, source_idx, sink_idx, parent):
-        path_flow = float("Inf")
-        s = sink_idx
-
-        while s != source_idx:
-            path_flow = min(path_flow, residual_graph[parent[s]][s])
-            s = parent[s]
-
-        v = sink_idx
-        while v != source_idx:
-            u = parent[v]
-            residual_graph[u][v] -= path_flow
-            residual_graph[v][u] += path_flow
-            flow_matrix[u][v] += path_flow
-            v = u
-
-        max_flow += path_flow
-
-    return max_flow, flow_matrix
\ No newline at end of file
+        # Principaux chemins source -> puits, issus de la décomposition du flot
+        chemins, _ = decomposer_flot(nodes, flow_matrix, self.data['source'], self.data['sink'])
+        chemins_frame = ttk.Frame(self.viz_frame)
+        chemins_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        ttk.Label(
+            chemins_frame,
+            text=f"Principaux chemins ({min(len(chemins), self.NB_CHEMINS)} sur {len(chemins)}):",
+        ).pack(anchor="w")
+
+        chemins_tree = ttk.Treeview(chemins_frame, columns=("Chemin", "Flot"), show="headings", height=self.NB_CHEMINS)
+        chemins_tree.heading("Chemin", text="Chemin")
+        chemins_tree.heading("Flot", text="Flot")
+        chemins_tree.column("Chemin", width=400, anchor="w")
+        chemins_tree.column("Flot", width=100, anchor="center")
+        for chemin, quantite in chemins[:self.NB_CHEMINS]:
+            chemins_tree.insert("", "end", values=(" → ".join(map(str, chemin)), quantite))
+        chemins_tree.pack(fill=tk.BOTH, expand=True)
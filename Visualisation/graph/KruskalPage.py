@@ -26,7 +26,7 @@ class KruskalPage(tk.Frame):
         # Informative title
         title_label = ttk.Label(
             main_frame,
-            text=f"Arbre Couvrant Minimal (Algorithme de Kruskal)",
+            text=f"Arbre Couvrant Minimal (moteur: {(data or {}).get('moteur', 'kruskal')})",
             font=("Arial", 12, "bold")
         )
         title_label.pack(pady=(0, 10))
@@ -102,7 +102,7 @@ class KruskalPage(tk.Frame):
         nx.draw_networkx_edge_labels(G, pos, ax=ax, edge_labels=edge_labels, font_color='red', font_size=9)
 
         # Set title with total weight
-        ax.set_title(f"Arbre Couvrant Minimal (Kruskal) - Poids total: {total_weight}", fontsize=12, pad=15)
+        ax.set_title(f"Arbre Couvrant Minimal ({self.data.get('moteur', 'kruskal')}) - Poids total: {total_weight}", fontsize=12, pad=15)
         
         # Disable axes
         ax.set_axis_off()
@@ -29,7 +29,7 @@ class WelshPowellPage(tk.Frame):
         num_colors = self.data['num_colors']
         title_label = ttk.Label(
             main_frame,
-            text=f"Coloration de graphe (Welsh-Powell) - {num_colors} couleurs utilisées",
+            text=f"Coloration de graphe ({self.data.get('moteur', 'welsh_powell')}) - {num_colors} couleurs utilisées",
             font=("Arial", 12, "bold")
         )
         title_label.pack(pady=(0, 10))
@@ -0,0 +1,104 @@
+import heapq
+import math
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
+
+
+def heuristique_euclidienne(coordonnees):
+    # Distance à vol d'oiseau dans le plan : admissible si chaque poids d'arête
+    # est au moins égal à la distance euclidienne entre ses extrémités
+    def h(sommet, cible):
+        (x1, y1), (x2, y2) = coordonnees[sommet], coordonnees[cible]
+        return math.hypot(x2 - x1, y2 - y1)
+    return h
+
+
+def heuristique_haversine(coordonnees, rayon=6371.0):
+    # Distance orthodromique entre (latitude, longitude) en degrés, en km par défaut
+    def h(sommet, cible):
+        lat1, lon1 = map(math.radians, coordonnees[sommet])
+        lat2, lon2 = map(math.radians, coordonnees[cible])
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+        return 2 * rayon * math.asin(min(1.0, math.sqrt(a)))
+    return h
+
+
+HEURISTIQUES = {
+    "euclidienne": heuristique_euclidienne,
+    "haversine": heuristique_haversine,
+}
+
+
+def a_etoile(sommets, matrice_adj, debut, fin, heuristique=None, coordonnees=None, index=None):
+    """Recherche A* du plus court chemin entre debut et fin.
+
+    heuristique : fonction h(sommet, cible) admissible, ou "euclidienne" / "haversine"
+    pour utiliser les coordonnées des sommets (MatriceAdjacence.coordonnees).
+    Sans heuristique, A* se comporte comme Dijkstra.
+
+    Retourne (chemin, explores) : explores est l'ensemble des sommets fixés,
+    utilisé par la visualisation pour montrer la zone parcourue.
+    """
+    if index is None:
+        index = index_sommets(sommets)
+    if debut not in index or fin not in index:
+        raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
+    start_idx = index[debut]
+    end_idx = index[fin]
+
+    n = len(sommets)
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+    adjacence = listes_adjacence(matrice_adj)
+
+    if isinstance(heuristique, str):
+        if heuristique not in HEURISTIQUES:
+            raise ValueError(f"Heuristique inconnue : {heuristique}")
+        if not coordonnees:
+            raise ValueError("Les coordonnées des sommets sont nécessaires pour cette heuristique")
+        heuristique = HEURISTIQUES[heuristique](coordonnees)
+
+    # Estimation vers la cible, calculée une seule fois par sommet
+    estimations = [None] * n
+
+    def h(i):
+        if heuristique is None:
+            return 0
+        if estimations[i] is None:
+            estimations[i] = heuristique(sommets[i], fin)
+        return estimations[i]
+
+    distances = [float('inf')] * n
+    distances[start_idx] = 0
+    predecesseurs = [None] * n
+    explores = set()
+
+    # File de priorité sur f = g + h
+    heap = [(h(start_idx), 0, start_idx)]
+    while heap:
+        _, dist_actuelle, noeud_actuel = heapq.heappop(heap)
+
+        # Ignorer les entrées obsolètes
+        if dist_actuelle > distances[noeud_actuel]:
+            continue
+        explores.add(sommets[noeud_actuel])
+
+        if noeud_actuel == end_idx:
+            break
+
+        for voisin, poids in adjacence[noeud_actuel]:
+            nouvelle_distance = dist_actuelle + poids
+            if nouvelle_distance < distances[voisin]:
+                distances[voisin] = nouvelle_distance
+                predecesseurs[voisin] = noeud_actuel
+                heapq.heappush(heap, (nouvelle_distance + h(voisin), nouvelle_distance, voisin))
+
+    if distances[end_idx] == float('inf'):
+        return [], explores
+
+    chemin = []
+    current = end_idx
+    while current is not None:
+        chemin.append(sommets[current])
+        current = predecesseurs[current]
+    return chemin[::-1], explores
@@ -0,0 +1,97 @@
+class ArbreCouvrantDynamique:
+    # Arbre (ou forêt) couvrant minimum maintenu sous insertions d'arêtes et
+    # diminutions de poids, sans relancer Kruskal. Propriété du cycle : une
+    # nouvelle arête u - v ferme un cycle avec le chemin u -> v de l'arbre ;
+    # elle entre dans l'arbre si elle est plus légère que l'arête la plus lourde
+    # de ce chemin, qui en sort. Chaque mise à jour coûte O(V).
+
+    def __init__(self, sommets, mst):
+        """sommets : noms des sommets ; mst : arêtes (u, v, poids) renvoyées par kruskal()"""
+        self.voisins = {sommet: {} for sommet in sommets}
+        for u, v, poids in mst:
+            self._relier(u, v, poids)
+
+    def _relier(self, u, v, poids):
+        self.voisins.setdefault(u, {})[v] = poids
+        self.voisins.setdefault(v, {})[u] = poids
+
+    def _delier(self, u, v):
+        del self.voisins[u][v]
+        del self.voisins[v][u]
+
+    def chemin(self, u, v):
+        """Chemin u -> v dans l'arbre (liste de sommets), [] si u et v ne sont pas reliés"""
+        if u not in self.voisins or v not in self.voisins:
+            return []
+        parent = {u: None}
+        pile = [u]
+        while pile:
+            x = pile.pop()
+            if x == v:
+                break
+            for y in self.voisins[x]:
+                if y not in parent:
+                    parent[y] = x
+                    pile.append(y)
+        if v not in parent:
+            return []
+        chemin = []
+        while v is not None:
+            chemin.append(v)
+            v = parent[v]
+        return chemin[::-1]
+
+    def arete_max(self, u, v):
+        """Arête la plus lourde (a, b, poids) du chemin u -> v de l'arbre, None s'il n'existe pas"""
+        chemin = self.chemin(u, v)
+        meilleure = None
+        for a, b in zip(chemin, chemin[1:]):
+            poids = self.voisins[a][b]
+            if meilleure is None or poids > meilleure[2]:
+                meilleure = (a, b, poids)
+        return meilleure
+
+    def ajouter_arete(self, u, v, poids):
+        """Insère l'arête u - v (ou diminue son poids) et met l'arbre à jour.
+
+        Retourne (ajoutee, retiree) : ajoutee indique si l'arête fait désormais
+        partie de l'arbre, retiree est l'arête (a, b, poids) qui en est sortie
+        (None si aucune).
+        """
+        if u == v:
+            return False, None
+        if v in self.voisins.get(u, {}):
+            # Arête déjà dans l'arbre : seule une diminution de poids la garde minimale
+            if poids < self.voisins[u][v]:
+                self._relier(u, v, poids)
+                return True, None
+            return False, None
+
+        lourde = self.arete_max(u, v)
+        if lourde is None:
+            # Deux composants distincts : l'arête les relie
+            self._relier(u, v, poids)
+            return True, None
+        if poids >= lourde[2]:
+            return False, None
+        self._delier(lourde[0], lourde[1])
+        self._relier(u, v, poids)
+        return True, lourde
+
+    def diminuer_poids(self, u, v, poids):
+        """Diminution du poids de l'arête u - v du graphe : même mise à jour qu'une insertion"""
+        return self.ajouter_arete(u, v, poids)
+
+    def aretes(self):
+        # Arêtes de l'arbre (u, v, poids), chacune une seule fois
+        vues = set()
+        resultat = []
+        for u, voisins in self.voisins.items():
+            for v, poids in voisins.items():
+                if (v, u) not in vues:
+                    vues.add((u, v))
+                    resultat.append((u, v, poids))
+        return resultat
+
+    def poids_total(self):
+        return sum(poids for _, _, poids in self.aretes())
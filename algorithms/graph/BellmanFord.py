@@ -1,37 +1,276 @@
-def bellmanFord(sommets, matrice_adj, debut, depart):
-    # Vérification des nœuds de départ et d'arrivée
-    try:
-        start_idx = sommets.index(debut)
-        end_idx = sommets.index(depart)
-    except ValueError:
-        raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
-    
-    n = len(sommets)
-    # Vérification de la taille de la matrice
-    if len(matrice_adj) != n or any(len(row) != n for row in matrice_adj):
-        raise ValueError("Matrice d'adjacence invalide")
-    
-    # Initialisation des distances et du chemin
+from collections import deque
+import numpy as np
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
+
+
+class CycleNegatifError(ValueError):
+    # Levée quand un cycle de poids négatif est atteignable ; cycle contient ses
+    # sommets dans l'ordre de parcours (le premier est répété à la fin), cycles
+    # tous les cycles négatifs disjoints trouvés par la relaxation
+
+    def __init__(self, cycles):
+        super().__init__("Le graphe contient un cycle de poids négatif")
+        self.cycles = cycles
+        self.cycle = cycles[0]
+
+
+def extraire_cycle(predecesseurs, v):
+    # Remonte les prédécesseurs depuis v ; renvoie le cycle rencontré ou None (O(V))
+    position = {}
+    chemin = []
+    while v is not None and v not in position:
+        position[v] = len(chemin)
+        chemin.append(v)
+        v = predecesseurs[v]
+    if v is None:
+        return None
+    cycle = chemin[position[v]:][::-1]
+    return cycle + [cycle[0]]
+
+
+def cycles_predecesseurs(predecesseurs):
+    # Tous les cycles du graphe des prédécesseurs, en un seul parcours linéaire.
+    # Chaque sommet n'a qu'un prédécesseur : les cycles sont donc disjoints, et
+    # pendant Bellman-Ford chacun d'eux est de poids négatif.
+    etat = [0] * len(predecesseurs)  # 0 : non vu, 1 : parcours en cours, 2 : traité
+    cycles = []
+    for depart in range(len(predecesseurs)):
+        chemin = []
+        v = depart
+        while v is not None and etat[v] == 0:
+            etat[v] = 1
+            chemin.append(v)
+            v = predecesseurs[v]
+        if v is not None and etat[v] == 1:
+            cycle = chemin[chemin.index(v):][::-1]
+            cycles.append(cycle + [cycle[0]])
+        for x in chemin:
+            etat[x] = 2
+    return cycles
+
+
+def retirer_cycles(cycles, predecesseurs, retires):
+    # Sort les sommets des cycles trouvés de la relaxation, et détache les sommets
+    # qui les avaient pour prédécesseur. Les sommets atteints depuis ces cycles
+    # restent relaxés : d'autres cycles négatifs disjoints peuvent s'y trouver.
+    # Retourne les sommets détachés.
+    for cycle in cycles:
+        for v in cycle[:-1]:
+            retires[v] = True
+    detaches = [v for v, p in enumerate(predecesseurs) if p is not None and retires[p]]
+    for v in detaches:
+        predecesseurs[v] = None
+    return detaches
+
+
+def initialiser(n, start_idx):
+    # start_idx=None : source virtuelle reliée à tous les sommets par un arc de poids 0,
+    # pour détecter les cycles négatifs de tout le graphe
+    if start_idx is None:
+        return [0] * n, n
     distances = [float('inf')] * n
     distances[start_idx] = 0
+    return distances, n - 1
+
+
+def relaxation_par_passes(n, aretes, start_idx):
+    # Bellman-Ford classique sur la liste d'arêtes, avec arrêt anticipé
+    # dès qu'une passe complète ne modifie plus aucune distance
+    distances, nb_passes = initialiser(n, start_idx)
     predecesseurs = [None] * n
+    retires = [False] * n
+    cycles = []
+
+    passe = 0
+    while True:
+        modifie = False
+        for u, v, poids in aretes:
+            if distances[u] + poids < distances[v]:
+                distances[v] = distances[u] + poids
+                predecesseurs[v] = u
+                modifie = True
+        if not modifie:
+            break
+        passe += 1
+        # Au-delà de nb_passes, une amélioration signale un cycle négatif : on
+        # continue de relaxer jusqu'à ce qu'il apparaisse dans les prédécesseurs,
+        # puis on le sort du graphe et on recommence le décompte des passes
+        if passe > nb_passes:
+            nouveaux = cycles_predecesseurs(predecesseurs)
+            if nouveaux:
+                cycles += nouveaux
+                retirer_cycles(nouveaux, predecesseurs, retires)
+                aretes = [(u, v, poids) for u, v, poids in aretes if not retires[u] and not retires[v]]
+                passe = 0
+
+    cycles += cycles_predecesseurs(predecesseurs)
+    if cycles:
+        raise CycleNegatifError(cycles)
+    return distances, predecesseurs
+
+
+def spfa(n, adjacence, start_idx):
+    # Variante à file (Shortest Path Faster Algorithm) : seuls les sommets dont la
+    # distance vient de baisser sont réexaminés. longueur[v] compte les arêtes du
+    # chemin courant vers v ; s'il atteint n, ce chemin contient un cycle négatif.
+    distances, _ = initialiser(n, start_idx)
+    predecesseurs = [None] * n
+    longueur = [0] * n
+    retires = [False] * n
+    cycles = []
+
+    file = deque(range(n) if start_idx is None else [start_idx])
+    dans_file = [False] * n
+    for u in file:
+        dans_file[u] = True
+    while file:
+        u = file.popleft()
+        dans_file[u] = False
+        if retires[u]:
+            continue
+        for v, poids in adjacence[u]:
+            if retires[v]:
+                continue
+            if distances[u] + poids < distances[v]:
+                distances[v] = distances[u] + poids
+                predecesseurs[v] = u
+                longueur[v] = longueur[u] + 1
+                if longueur[v] >= n and extraire_cycle(predecesseurs, v):
+                    nouveaux = cycles_predecesseurs(predecesseurs)
+                    cycles += nouveaux
+                    for x in retirer_cycles(nouveaux, predecesseurs, retires):
+                        longueur[x] = 0
+                if not retires[v] and not dans_file[v]:
+                    file.append(v)
+                    dans_file[v] = True
+                if retires[u]:
+                    # u était sur le cycle retiré : ses autres arêtes ne comptent plus
+                    break
+
+    cycles += cycles_predecesseurs(predecesseurs)
+    if cycles:
+        raise CycleNegatifError(cycles)
+    return distances, predecesseurs
+
+
+def relaxation_vectorisee(n, src, dst, w, start_idx):
+    # Arêtes stockées dans trois tableaux NumPy : chaque passe relaxe toutes les
+    # arêtes d'un coup (minimum par destination avec np.minimum.at)
+    distances_init, nb_passes = initialiser(n, start_idx)
+    distances = np.array(distances_init, dtype=float)
+    predecesseurs = np.full(n, -1, dtype=np.int64)
+
+    retires = [False] * n
+    cycles = []
+
+    passe = 0
+    while True:
+        candidats = distances[src] + w
+        nouvelles = distances.copy()
+        np.minimum.at(nouvelles, dst, candidats)
+        ameliores = nouvelles < distances
+        if not ameliores.any():
+            break
+        # Prédécesseur : une arête qui réalise le nouveau minimum
+        realise = ameliores[dst] & (candidats == nouvelles[dst])
+        predecesseurs[dst[realise]] = src[realise]
+        distances = nouvelles
+        passe += 1
+        if passe > nb_passes:
+            liste = [None if p == -1 else p for p in predecesseurs.tolist()]
+            nouveaux = cycles_predecesseurs(liste)
+            if nouveaux:
+                # Cycles sortis du graphe : on ne garde que les arêtes entre sommets restants
+                cycles += nouveaux
+                predecesseurs[retirer_cycles(nouveaux, liste, retires)] = -1
+                restants = ~np.array(retires)
+                garde = restants[src] & restants[dst]
+                src, dst, w = src[garde], dst[garde], w[garde]
+                passe = 0
+
+    # Retour aux listes Python (et aux entiers si tous les poids sont entiers)
+    predecesseurs = [None if p == -1 else p for p in predecesseurs.tolist()]
+    cycles += cycles_predecesseurs(predecesseurs)
+    if cycles:
+        raise CycleNegatifError(cycles)
+    entiers = np.issubdtype(w.dtype, np.integer)
+    distances = [int(d) if entiers and d != np.inf else float(d) for d in distances.tolist()]
+    return distances, predecesseurs
+
+
+MODES = ("standard", "spfa", "vectorise")
+
+
+def executer(adjacence, start_idx, mode):
+    # Lance le moteur choisi ; start_idx=None pour la source virtuelle
+    n = len(adjacence)
+    if mode not in MODES:
+        raise ValueError(f"Le mode doit être l'un de {', '.join(MODES)}")
+    if mode == "spfa":
+        return spfa(n, adjacence, start_idx)
+
+    # Liste des arêtes (u, v, poids), parcourue en O(E) à chaque passe
+    aretes = [(u, v, poids) for u, voisins in enumerate(adjacence) for v, poids in voisins]
+    if mode == "vectorise":
+        src = np.array([u for u, _, _ in aretes], dtype=np.int64)
+        dst = np.array([v for _, v, _ in aretes], dtype=np.int64)
+        w = np.array([poids for _, _, poids in aretes]) if aretes else np.zeros(0)
+        return relaxation_vectorisee(n, src, dst, w, start_idx)
+    return relaxation_par_passes(n, aretes, start_idx)
+
+
+def distances_bellman_ford(sommets, matrice_adj, debut, index=None, mode="standard"):
+    # Distances et prédécesseurs depuis debut vers tous les sommets
+    # mode="standard" : passes successives sur toutes les arêtes
+    # mode="spfa" : file des sommets à réexaminer, efficace sur les graphes creux
+    # mode="vectorise" : passes NumPy sur les tableaux src/dst/w, pour les grands graphes
+    # Un cycle négatif atteignable lève CycleNegatifError (sous-classe de ValueError)
+    if index is None:
+        index = index_sommets(sommets)
+    if debut not in index:
+        raise ValueError("Le nœud de départ n'existe pas")
+    start_idx = index[debut]
+
+    n = len(sommets)
+    # Vérification de la taille de la matrice
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+
+    try:
+        return executer(listes_adjacence(matrice_adj), start_idx, mode)
+    except CycleNegatifError as e:
+        raise CycleNegatifError([[sommets[i] for i in cycle] for cycle in e.cycles]) from None
+
+
+def cycles_negatifs(sommets, matrice_adj, mode="standard"):
+    """Tous les cycles négatifs disjoints du graphe, en une seule exécution.
+
+    Une source virtuelle relie tous les sommets (détection de l'arbitrage sur un
+    graphe de taux, par exemple). Chaque cycle détecté dans le graphe des
+    prédécesseurs est sorti de la relaxation, qui continue jusqu'à ce qu'une passe
+    ne change plus rien : le graphe privé des cycles renvoyés n'a plus de cycle
+    négatif. Liste vide si aucun cycle.
+    """
+    n = len(sommets)
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+    try:
+        executer(listes_adjacence(matrice_adj), None, mode)
+    except CycleNegatifError as e:
+        return [[sommets[i] for i in cycle] for cycle in e.cycles]
+    return []
+
+
+def bellmanFord(sommets, matrice_adj, debut, depart, index=None, mode="standard"):
+    # Vérification des nœuds de départ et d'arrivée
+    # index : dictionnaire nom -> indice (MatriceAdjacence.index), construit si absent
+    if index is None:
+        index = index_sommets(sommets)
+    if debut not in index or depart not in index:
+        raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
+    end_idx = index[depart]
     
-    # Relaxation des arêtes (n-1 fois)
-    for _ in range(n - 1):
-        for u in range(n):
-            for v in range(n):
-                poids = matrice_adj[u][v]
-                if poids != 0:  # Si arête existe
-                    if distances[u] + poids < distances[v]:
-                        distances[v] = distances[u] + poids
-                        predecesseurs[v] = u
-    
-    # Vérification des cycles de poids négatif
-    for u in range(n):
-        for v in range(n):
-            poids = matrice_adj[u][v]
-            if poids != 0 and distances[u] + poids < distances[v]:
-                raise ValueError("Le graphe contient un cycle de poids négatif")
+    distances, predecesseurs = distances_bellman_ford(sommets, matrice_adj, debut, index, mode)
     
     # Reconstruction du chemin
     chemin = []
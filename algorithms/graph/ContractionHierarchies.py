@@ -0,0 +1,282 @@
+import heapq
+import json
+import numpy as np
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
+
+
+def _nom_hachable(valeur):
+    # JSON relit les tuples (coordonnées de grille, par exemple) comme des listes ;
+    # un nom de sommet étant toujours hachable, toute liste était un tuple
+    if isinstance(valeur, list):
+        return tuple(_nom_hachable(element) for element in valeur)
+    return valeur
+
+
+class ContractionHierarchies:
+    # Hiérarchies de contraction : prétraitement unique d'un graphe statique
+    # (ordre des sommets + raccourcis), puis requêtes point à point par une
+    # recherche bidirectionnelle qui ne monte que vers les sommets de rang supérieur.
+    #
+    # Chaque arête montante est stockée avec son "milieu" : -1 pour une arête
+    # d'origine, sinon le sommet contracté qu'elle court-circuite. Cela permet de
+    # redéplier un raccourci en chemin du graphe d'origine.
+
+    def __init__(self, sommets, rang, avant, arriere):
+        self.sommets = sommets
+        self.index = index_sommets(sommets)
+        self.rang = rang
+        self.avant = avant      # avant[u] = [(v, poids, milieu)] avec rang[v] > rang[u]
+        self.arriere = arriere  # arriere[v] = [(u, poids, milieu)] pour l'arc u -> v, rang[u] > rang[v]
+        self._milieux = {}
+        for u, aretes in enumerate(avant):
+            for v, _, milieu in aretes:
+                self._milieux[(u, v)] = milieu
+        for v, aretes in enumerate(arriere):
+            for u, _, milieu in aretes:
+                self._milieux[(u, v)] = milieu
+
+    @classmethod
+    def construire(cls, sommets, matrice_adj, index=None, limite_temoin=500):
+        """Prétraitement : contracte les sommets un à un par différence d'arêtes croissante.
+
+        limite_temoin borne le nombre de sommets fixés par recherche de témoin ;
+        une recherche interrompue ajoute au pire un raccourci inutile, jamais faux.
+        """
+        n = len(sommets)
+        if not matrice_valide(matrice_adj, n):
+            raise ValueError("Matrice d'adjacence invalide")
+        for voisins in listes_adjacence(matrice_adj):
+            if any(poids < 0 for _, poids in voisins):
+                raise ValueError("Les hiérarchies de contraction exigent des poids positifs")
+
+        # Graphe restant (non contracté) : sortants[u][v] = [poids, milieu], entrants[v][u] = même liste
+        sortants = [{} for _ in range(n)]
+        entrants = [{} for _ in range(n)]
+        for u, voisins in enumerate(listes_adjacence(matrice_adj)):
+            for v, poids in voisins:
+                if u != v:
+                    arete = [poids, -1]
+                    sortants[u][v] = arete
+                    entrants[v][u] = arete
+
+        contracte = [False] * n
+        voisins_contractes = [0] * n
+
+        def temoins(u, exclu, cibles, limite):
+            # Dijkstra limité depuis u sans passer par exclu ; distances vers les cibles
+            distances = {u: 0}
+            heap = [(0, u)]
+            restantes = set(cibles)
+            fixes = 0
+            while heap and restantes and fixes < limite_temoin:
+                dist, x = heapq.heappop(heap)
+                if dist > distances[x]:
+                    continue
+                if dist > limite:
+                    break
+                restantes.discard(x)
+                fixes += 1
+                for y, (poids, _) in sortants[x].items():
+                    if y == exclu:
+                        continue
+                    nouvelle = dist + poids
+                    if nouvelle < distances.get(y, float('inf')):
+                        distances[y] = nouvelle
+                        heapq.heappush(heap, (nouvelle, y))
+            return distances
+
+        def raccourcis(v):
+            # Raccourcis (u, w, poids) nécessaires si v est contracté maintenant
+            resultat = []
+            sortie = [(w, arete[0]) for w, arete in sortants[v].items()]
+            if not sortie:
+                return resultat
+            max_sortie = max(poids for _, poids in sortie)
+            for u, (poids_uv, _) in entrants[v].items():
+                cibles = [w for w, _ in sortie if w != u]
+                if not cibles:
+                    continue
+                distances = temoins(u, v, cibles, poids_uv + max_sortie)
+                for w, poids_vw in sortie:
+                    if w == u:
+                        continue
+                    candidat = poids_uv + poids_vw
+                    if distances.get(w, float('inf')) > candidat:
+                        resultat.append((u, w, candidat))
+            return resultat
+
+        def priorite(v):
+            return len(raccourcis(v)) - len(sortants[v]) - len(entrants[v]) + voisins_contractes[v]
+
+        heap = [(priorite(v), v) for v in range(n)]
+        heapq.heapify(heap)
+        rang = [0] * n
+        avant = [[] for _ in range(n)]
+        arriere = [[] for _ in range(n)]
+        niveau = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracte[v]:
+                continue
+            # Mise à jour paresseuse : on recalcule, et on remet en file si v n'est plus le minimum
+            p = priorite(v)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+
+            for u, w, candidat in raccourcis(v):
+                existante = sortants[u].get(w)
+                if existante is None:
+                    arete = [candidat, v]
+                    sortants[u][w] = arete
+                    entrants[w][u] = arete
+                elif candidat < existante[0]:
+                    existante[0] = candidat
+                    existante[1] = v
+
+            # Les arêtes restantes de v mènent toutes vers des sommets de rang supérieur
+            for w, (poids, milieu) in sortants[v].items():
+                avant[v].append((w, poids, milieu))
+                del entrants[w][v]
+                voisins_contractes[w] += 1
+            for u, (poids, milieu) in entrants[v].items():
+                arriere[v].append((u, poids, milieu))
+                del sortants[u][v]
+                voisins_contractes[u] += 1
+            sortants[v].clear()
+            entrants[v].clear()
+
+            contracte[v] = True
+            rang[v] = niveau
+            niveau += 1
+
+        return cls(list(sommets), rang, avant, arriere)
+
+    def sauvegarder(self, chemin_fichier):
+        """Enregistre la hiérarchie dans un fichier .npz
+
+        Les poids gardent leur type : entiers (int64) si tous les poids le sont,
+        réels (float64) sinon, pour que charger() rende les mêmes distances.
+        """
+        donnees = {
+            "sommets": np.array(json.dumps(self.sommets)),
+            "rang": np.array(self.rang, dtype=np.int64),
+        }
+        entiers = all(
+            isinstance(poids, (int, np.integer))
+            for listes in (self.avant, self.arriere)
+            for aretes in listes
+            for _, poids, _ in aretes
+        )
+        type_poids = np.int64 if entiers else np.float64
+        for nom, listes in (("avant", self.avant), ("arriere", self.arriere)):
+            indptr = np.zeros(len(listes) + 1, dtype=np.int64)
+            np.cumsum([len(aretes) for aretes in listes], out=indptr[1:])
+            aretes = [arete for liste in listes for arete in liste]
+            donnees[f"{nom}_indptr"] = indptr
+            donnees[f"{nom}_voisins"] = np.array([a[0] for a in aretes], dtype=np.int64)
+            donnees[f"{nom}_poids"] = np.array([a[1] for a in aretes], dtype=type_poids)
+            donnees[f"{nom}_milieux"] = np.array([a[2] for a in aretes], dtype=np.int64)
+        np.savez(chemin_fichier, **donnees)
+
+    @classmethod
+    def charger(cls, chemin_fichier):
+        with np.load(chemin_fichier) as donnees:
+            sommets = [_nom_hachable(sommet) for sommet in json.loads(str(donnees["sommets"]))]
+            listes = {}
+            for nom in ("avant", "arriere"):
+                indptr = donnees[f"{nom}_indptr"].tolist()
+                voisins = donnees[f"{nom}_voisins"].tolist()
+                poids = donnees[f"{nom}_poids"].tolist()
+                milieux = donnees[f"{nom}_milieux"].tolist()
+                listes[nom] = [
+                    list(zip(voisins[indptr[i]:indptr[i + 1]],
+                             poids[indptr[i]:indptr[i + 1]],
+                             milieux[indptr[i]:indptr[i + 1]]))
+                    for i in range(len(sommets))
+                ]
+            return cls(sommets, donnees["rang"].tolist(), listes["avant"], listes["arriere"])
+
+    def _rechercher(self, start_idx, end_idx):
+        # Recherche bidirectionnelle montante ; renvoie (distance, sommet de rencontre, prédécesseurs)
+        graphes = (self.avant, self.arriere)
+        distances = ({start_idx: 0}, {end_idx: 0})
+        predecesseurs = ({start_idx: None}, {end_idx: None})
+        heaps = ([(0, start_idx)], [(0, end_idx)])
+        meilleur = float('inf')
+        rencontre = None
+
+        while heaps[0] or heaps[1]:
+            for sens in (0, 1):
+                if not heaps[sens]:
+                    continue
+                dist, x = heapq.heappop(heaps[sens])
+                if dist > distances[sens][x]:
+                    continue
+                # Les arêtes montantes ne mènent qu'à des distances plus grandes
+                if dist >= meilleur:
+                    heaps[sens].clear()
+                    continue
+                if x in distances[1 - sens] and dist + distances[1 - sens][x] < meilleur:
+                    meilleur = dist + distances[1 - sens][x]
+                    rencontre = x
+                for y, poids, _ in graphes[sens][x]:
+                    nouvelle = dist + poids
+                    if nouvelle < distances[sens].get(y, float('inf')):
+                        distances[sens][y] = nouvelle
+                        predecesseurs[sens][y] = x
+                        heapq.heappush(heaps[sens], (nouvelle, y))
+
+        return meilleur, rencontre, predecesseurs
+
+    def _deplier(self, u, v):
+        # Remplace récursivement les raccourcis par les sommets qu'ils court-circuitent
+        chemin = [u]
+        pile = [(u, v)]
+        while pile:
+            a, b = pile.pop()
+            milieu = self._milieux[(a, b)]
+            if milieu == -1:
+                chemin.append(b)
+            else:
+                pile.append((milieu, b))
+                pile.append((a, milieu))
+        return chemin
+
+    def requete(self, debut, fin):
+        """Plus court chemin entre debut et fin, au format de djikstra()
+
+        La longueur du chemin est toujours celle du chemin de djikstra ; quand
+        plusieurs plus courts chemins sont à égalité, celui renvoyé peut différer.
+        """
+        if debut not in self.index or fin not in self.index:
+            raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
+        start_idx = self.index[debut]
+        end_idx = self.index[fin]
+
+        meilleur, rencontre, predecesseurs = self._rechercher(start_idx, end_idx)
+        if rencontre is None:
+            return []
+
+        # Suite des arêtes de la hiérarchie : source -> rencontre -> destination
+        noeuds = []
+        current = rencontre
+        while current is not None:
+            noeuds.append(current)
+            current = predecesseurs[0][current]
+        noeuds.reverse()
+        current = predecesseurs[1][rencontre]
+        while current is not None:
+            noeuds.append(current)
+            current = predecesseurs[1][current]
+
+        chemin = [start_idx]
+        for a, b in zip(noeuds, noeuds[1:]):
+            chemin.extend(self._deplier(a, b)[1:])
+        return [self.sommets[i] for i in chemin]
+
+    def distance(self, debut, fin):
+        if debut not in self.index or fin not in self.index:
+            raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
+        return self._rechercher(self.index[debut], self.index[fin])[0]
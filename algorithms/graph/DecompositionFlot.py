@@ -0,0 +1,82 @@
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
+
+
+def decomposer_flot(sommets, flow_matrix, source, sink, index=None):
+    """Décompose un flot (matrice dense ou MatriceCSR) en chemins et cycles pondérés.
+
+    Chaque extraction annule au moins un arc, d'où au plus E éléments ; un pointeur
+    d'arc courant par sommet fait que chaque arc épuisé n'est plus jamais relu.
+    Retourne (chemins, cycles) : chemins = [(chemin source -> puits, quantité)]
+    triés par quantité décroissante, cycles = [(cycle, quantité)] où le cycle
+    répète son premier sommet à la fin (comme pour Bellman-Ford).
+    """
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    if not matrice_valide(flow_matrix, n):
+        raise ValueError("Matrice de flot invalide")
+    s, t = index[source], index[sink]
+
+    # Flot restant par arc : sortants[u] = [[v, quantité], ...] (boucles ignorées)
+    sortants = [
+        [[v, f] for v, f in voisins if f > 0 and v != u]
+        for u, voisins in enumerate(listes_adjacence(flow_matrix))
+    ]
+    courant = [0] * n
+    chemins = []
+    cycles = []
+
+    def arc_suivant(u):
+        # Premier arc de u portant encore du flot
+        arcs = sortants[u]
+        while courant[u] < len(arcs) and arcs[courant[u]][1] <= 0:
+            courant[u] += 1
+        return arcs[courant[u]] if courant[u] < len(arcs) else None
+
+    def extraire(arcs):
+        quantite = min(arc[1] for arc in arcs)
+        for arc in arcs:
+            arc[1] -= quantite
+        return quantite
+
+    def parcourir(depart):
+        # Suit le flot depuis depart ; un sommet revisité ferme un cycle, extrait aussitôt
+        pile = [depart]
+        arcs = []
+        position = {depart: 0}
+        while True:
+            u = pile[-1]
+            if u == t and depart == s:
+                quantite = extraire(arcs)
+                chemins.append(([sommets[v] for v in pile], quantite))
+                return True
+            arc = arc_suivant(u)
+            if arc is None:
+                if len(pile) == 1:
+                    return False
+                raise ValueError("Le flot ne respecte pas la conservation aux sommets intermédiaires")
+            v = arc[0]
+            if v in position:
+                k = position[v]
+                quantite = extraire(arcs[k:] + [arc])
+                cycles.append(([sommets[x] for x in pile[k:]] + [sommets[v]], quantite))
+                for x in pile[k + 1:]:
+                    del position[x]
+                del pile[k + 1:], arcs[k:]
+                continue
+            position[v] = len(pile)
+            pile.append(v)
+            arcs.append(arc)
+
+    if s != t:
+        while parcourir(s):
+            pass
+    # Le flot restant ne contient plus que des cycles
+    for u in range(n):
+        while arc_suivant(u) is not None:
+            parcourir(u)
+
+    chemins.sort(key=lambda element: element[1], reverse=True)
+    return chemins, cycles
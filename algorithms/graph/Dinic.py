@@ -0,0 +1,176 @@
+from collections import deque
+from data.graph_models import MatriceCSR, index_sommets, listes_adjacence, matrice_valide
+
+
+class ReseauFlot:
+    # Réseau résiduel sur tableaux d'arcs : l'arc e et son arc retour e ^ 1 sont
+    # stockés côte à côte, adj[u] contient les indices des arcs sortant de u.
+    # Les arcs pairs sont les arcs d'origine, les arcs impairs leurs retours.
+
+    def __init__(self, n):
+        self.n = n
+        self.adj = [[] for _ in range(n)]
+        self.dest = []
+        self.cap = []        # capacité résiduelle
+        self.capacite = []   # capacité d'origine (0 pour les arcs retour)
+
+    @classmethod
+    def depuis_matrice(cls, matrice_adj):
+        reseau = cls(len(matrice_adj))
+        for u, voisins in enumerate(listes_adjacence(matrice_adj)):
+            for v, capacite in voisins:
+                if capacite > 0 and u != v:
+                    reseau.ajouter_arc(u, v, capacite)
+        return reseau
+
+    def ajouter_arc(self, u, v, capacite):
+        e = len(self.dest)
+        self.dest += [v, u]
+        self.cap += [capacite, 0]
+        self.capacite += [capacite, 0]
+        self.adj[u].append(e)
+        self.adj[v].append(e + 1)
+        return e
+
+    def origine(self, e):
+        return self.dest[e ^ 1]
+
+    def flot(self, e):
+        return self.capacite[e] - self.cap[e]
+
+    def matrice_flot(self):
+        # Flot par arc d'origine sous forme de matrice dense n×n
+        flow_matrix = [[0] * self.n for _ in range(self.n)]
+        for e in range(0, len(self.dest), 2):
+            flow_matrix[self.origine(e)][self.dest[e]] += self.flot(e)
+        return flow_matrix
+
+    def flot_creux(self):
+        # Flot par arc d'origine au format CSR (seuls les arcs de flot non nul)
+        aretes = {}
+        for e in range(0, len(self.dest), 2):
+            f = self.flot(e)
+            if f:
+                cle = (self.origine(e), self.dest[e])
+                aretes[cle] = aretes.get(cle, 0) + f
+        return MatriceCSR.depuis_aretes(self.n, aretes)
+
+    def sortie(self, format_sortie):
+        if format_sortie == "dense":
+            return self.matrice_flot()
+        if format_sortie == "csr":
+            return self.flot_creux()
+        raise ValueError("Le format de sortie doit être 'dense' ou 'csr'")
+
+
+def niveaux_bfs(reseau, s):
+    # Graphe de niveaux : distance en arcs résiduels depuis s (-1 si inaccessible)
+    niveau = [-1] * reseau.n
+    niveau[s] = 0
+    file = deque([s])
+    while file:
+        u = file.popleft()
+        for e in reseau.adj[u]:
+            v = reseau.dest[e]
+            if niveau[v] < 0 and reseau.cap[e] > 0:
+                niveau[v] = niveau[u] + 1
+                file.append(v)
+    return niveau
+
+
+def flot_bloquant(reseau, s, t, niveau):
+    # Flot bloquant dans le graphe de niveaux avec pointeurs d'arc courant :
+    # un arc saturé ou sans issue n'est plus jamais réexaminé dans cette phase
+    courant = [0] * reseau.n
+    adj, dest, cap = reseau.adj, reseau.dest, reseau.cap
+    total = 0
+    while True:
+        chemin = []
+        u = s
+        while u != t:
+            avance = False
+            while courant[u] < len(adj[u]):
+                e = adj[u][courant[u]]
+                v = dest[e]
+                if cap[e] > 0 and niveau[v] == niveau[u] + 1:
+                    chemin.append(e)
+                    u = v
+                    avance = True
+                    break
+                courant[u] += 1
+            if not avance:
+                if u == s:
+                    return total
+                # Impasse : on recule et on passe à l'arc suivant du sommet précédent
+                niveau[u] = -1
+                e = chemin.pop()
+                u = dest[e ^ 1]
+                courant[u] += 1
+
+        path_flow = min(cap[e] for e in chemin)
+        for e in chemin:
+            cap[e] -= path_flow
+            cap[e ^ 1] += path_flow
+        total += path_flow
+
+
+def coupe_minimale(reseau, s, sommets):
+    # Coupe minimale lue sur le réseau résiduel final, en un seul parcours linéaire :
+    # côté source = sommets encore atteignables depuis s, arêtes coupées = arcs
+    # d'origine qui quittent ce côté (tous saturés)
+    atteint = [False] * reseau.n
+    atteint[s] = True
+    file = deque([s])
+    while file:
+        u = file.popleft()
+        for e in reseau.adj[u]:
+            v = reseau.dest[e]
+            if not atteint[v] and reseau.cap[e] > 0:
+                atteint[v] = True
+                file.append(v)
+
+    aretes = []
+    for e in range(0, len(reseau.dest), 2):
+        u, v = reseau.origine(e), reseau.dest[e]
+        if atteint[u] and not atteint[v]:
+            aretes.append((sommets[u], sommets[v], reseau.capacite[e]))
+    return {
+        "cote_source": [sommets[u] for u in range(reseau.n) if atteint[u]],
+        "aretes": aretes,
+        "capacite": sum(c for _, _, c in aretes),
+    }
+
+
+def dinic_reseau(reseau, s, t):
+    # Augmente le flot du réseau (éventuellement déjà partiellement rempli) jusqu'au maximum
+    max_flow = 0
+    if s == t:
+        return max_flow
+    while True:
+        niveau = niveaux_bfs(reseau, s)
+        if niveau[t] < 0:
+            return max_flow
+        max_flow += flot_bloquant(reseau, s, t, niveau)
+
+
+def dinic(sommets, matrice_adj, source, sink, index=None, sortie="dense", coupe=False):
+    """Flot maximum par l'algorithme de Dinic, en O(V²E).
+
+    Même contrat que fordFulkerson : (max_flow, flow_matrix). Avec sortie="csr",
+    le flot est renvoyé sous forme de MatriceCSR (arcs de flot non nul uniquement),
+    adapté aux grands réseaux. Avec coupe=True, un troisième élément donne la
+    coupe minimale (voir coupe_minimale).
+    """
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+
+    reseau = ReseauFlot.depuis_matrice(matrice_adj)
+    max_flow = dinic_reseau(reseau, index[source], index[sink])
+    if coupe:
+        return max_flow, reseau.sortie(sortie), coupe_minimale(reseau, index[source], sommets)
+    return max_flow, reseau.sortie(sortie)
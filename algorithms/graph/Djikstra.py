@@ -1,17 +1,28 @@
 import heapq
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
 
-def djikstra(sommets, matrice_adj, debut, depart):
+def djikstra(sommets, matrice_adj, debut, depart, index=None, mode="standard"):
+    # mode="standard" : recherche depuis la source uniquement
+    # mode="bidirectionnel" : fronts avant et arrière qui se rejoignent au milieu
+    if mode not in ("standard", "bidirectionnel"):
+        raise ValueError("Le mode doit être 'standard' ou 'bidirectionnel'")
     # Vérification des nœuds de départ et d'arrivée
-    try:
-        start_idx = sommets.index(debut)
-        end_idx = sommets.index(depart)
-    except ValueError:
+    # index : dictionnaire nom -> indice (MatriceAdjacence.index), construit si absent
+    if index is None:
+        index = index_sommets(sommets)
+    if debut not in index or depart not in index:
         raise ValueError("Le nœud de départ ou d'arrivée n'existe pas")
+    start_idx = index[debut]
+    end_idx = index[depart]
     
     n = len(sommets)
     # Vérification de la taille de la matrice
-    if len(matrice_adj) != n or any(len(row) != n for row in matrice_adj):
+    if not matrice_valide(matrice_adj, n):
         raise ValueError("Matrice d'adjacence invalide")
+    adjacence = listes_adjacence(matrice_adj)
+    
+    if mode == "bidirectionnel":
+        return djikstra_bidirectionnel(sommets, adjacence, start_idx, end_idx)
     
     # Initialisation des distances et du chemin
     distances = [float('inf')] * n
@@ -34,18 +45,14 @@ def djikstra(sommets, matrice_adj, debut, depart):
             continue
         
         # Explorer les voisins
-        for voisin in range(n):
-            poids = matrice_adj[noeud_actuel][voisin]
+        for voisin, poids in adjacence[noeud_actuel]:
+            nouvelle_distance = distances[noeud_actuel] + poids
             
-            # Vérifier s'il y a une connexion (suppose que 0 = pas de connexion)
-            if poids != 0:
-                nouvelle_distance = distances[noeud_actuel] + poids
-                
-                # Mise à jour si meilleur chemin trouvé
-                if nouvelle_distance < distances[voisin]:
-                    distances[voisin] = nouvelle_distance
-                    predecesseurs[voisin] = noeud_actuel
-                    heapq.heappush(heap, (nouvelle_distance, voisin))
+            # Mise à jour si meilleur chemin trouvé
+            if nouvelle_distance < distances[voisin]:
+                distances[voisin] = nouvelle_distance
+                predecesseurs[voisin] = noeud_actuel
+                heapq.heappush(heap, (nouvelle_distance, voisin))
     
     # Reconstruction du chemin
     chemin = []
@@ -59,4 +66,158 @@ def djikstra(sommets, matrice_adj, debut, depart):
         chemin.append(sommets[current])
         current = predecesseurs[current]
     
-    return chemin[::-1]  # Inverser pour avoir du départ à l'arrivée
\ No newline at end of file
+    return chemin[::-1]  # Inverser pour avoir du départ à l'arrivée
+
+
+def adjacence_inverse(adjacence):
+    # Listes des arcs entrants : (u, poids) pour chaque arc u -> v
+    inverse = [[] for _ in adjacence]
+    for u, voisins in enumerate(adjacence):
+        for v, poids in voisins:
+            inverse[v].append((u, poids))
+    return inverse
+
+
+def djikstra_bidirectionnel(sommets, adjacence, start_idx, end_idx):
+    # Deux recherches simultanées : depuis la source sur les arcs sortants,
+    # depuis la destination sur les arcs entrants. On s'arrête quand la somme
+    # des deux minima de file dépasse le meilleur chemin déjà rencontré.
+    if start_idx == end_idx:
+        return [sommets[start_idx]]
+
+    n = len(sommets)
+    graphes = (adjacence, adjacence_inverse(adjacence))
+    distances = ([float('inf')] * n, [float('inf')] * n)
+    predecesseurs = ([None] * n, [None] * n)
+    heaps = ([(0, start_idx)], [(0, end_idx)])
+    distances[0][start_idx] = 0
+    distances[1][end_idx] = 0
+
+    meilleur = float('inf')
+    rencontre = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= meilleur:
+            break
+
+        # On avance le front dont la file est la plus petite
+        sens = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        dist_actuelle, noeud_actuel = heapq.heappop(heaps[sens])
+        if dist_actuelle > distances[sens][noeud_actuel]:
+            continue
+
+        for voisin, poids in graphes[sens][noeud_actuel]:
+            nouvelle_distance = dist_actuelle + poids
+            if nouvelle_distance < distances[sens][voisin]:
+                distances[sens][voisin] = nouvelle_distance
+                predecesseurs[sens][voisin] = noeud_actuel
+                heapq.heappush(heaps[sens], (nouvelle_distance, voisin))
+            # Mise à jour du meilleur chemin passant par l'arc exploré
+            total = nouvelle_distance + distances[1 - sens][voisin]
+            if total < meilleur:
+                meilleur = total
+                rencontre = voisin
+
+    if rencontre is None:
+        return []
+
+    # Reconstruction : source -> rencontre, puis rencontre -> destination
+    chemin = []
+    current = rencontre
+    while current is not None:
+        chemin.append(sommets[current])
+        current = predecesseurs[0][current]
+    chemin.reverse()
+    current = predecesseurs[1][rencontre]
+    while current is not None:
+        chemin.append(sommets[current])
+        current = predecesseurs[1][current]
+    return chemin
+
+
+class ArbreChemins:
+    # Résultat d'un Dijkstra depuis une source : distances et prédécesseurs.
+    # Les chemins ne sont reconstruits qu'à la demande, cible par cible.
+
+    def __init__(self, sommets, index, source_idx, distances, predecesseurs):
+        self.sommets = sommets
+        self.index = index
+        self.source_idx = source_idx
+        self.distances = distances
+        self.predecesseurs = predecesseurs
+
+    def distance(self, sommet):
+        return self.distances[self.index[sommet]]
+
+    def chemin(self, sommet):
+        current = self.index[sommet]
+        if self.distances[current] == float('inf'):
+            return []
+        chemin = []
+        while current is not None:
+            chemin.append(self.sommets[current])
+            current = self.predecesseurs[current]
+        return chemin[::-1]
+
+
+class DijkstraMoteur:
+    # Dijkstra sur listes d'adjacence (ou CSR) en O((V+E) log V).
+    # Les listes sont construites une seule fois puis réutilisées pour toutes
+    # les requêtes lancées depuis le même graphe.
+
+    def __init__(self, sommets, matrice_adj, index=None):
+        n = len(sommets)
+        if not matrice_valide(matrice_adj, n):
+            raise ValueError("Matrice d'adjacence invalide")
+        self.sommets = sommets
+        self.index = index if index is not None else index_sommets(sommets)
+        self.adjacence = listes_adjacence(matrice_adj)
+
+    def _indice(self, sommet):
+        if sommet not in self.index:
+            raise ValueError(f"Le nœud {sommet} n'existe pas")
+        return self.index[sommet]
+
+    def _explorer(self, start_idx, cibles=None):
+        # cibles : ensemble d'indices ; la recherche s'arrête dès qu'ils sont tous fixés
+        n = len(self.sommets)
+        distances = [float('inf')] * n
+        distances[start_idx] = 0
+        predecesseurs = [None] * n
+        restantes = set(cibles) if cibles is not None else None
+
+        heap = [(0, start_idx)]
+        while heap:
+            dist_actuelle, noeud_actuel = heapq.heappop(heap)
+            if dist_actuelle > distances[noeud_actuel]:
+                continue
+
+            if restantes is not None:
+                restantes.discard(noeud_actuel)
+                if not restantes:
+                    break
+
+            for voisin, poids in self.adjacence[noeud_actuel]:
+                nouvelle_distance = dist_actuelle + poids
+                if nouvelle_distance < distances[voisin]:
+                    distances[voisin] = nouvelle_distance
+                    predecesseurs[voisin] = noeud_actuel
+                    heapq.heappush(heap, (nouvelle_distance, voisin))
+
+        return ArbreChemins(self.sommets, self.index, start_idx, distances, predecesseurs)
+
+    def arbre(self, source):
+        """Arbre complet des plus courts chemins depuis source (un-vers-tous)"""
+        return self._explorer(self._indice(source))
+
+    def vers_cibles(self, source, cibles):
+        """Plus courts chemins vers un ensemble de cibles, arrêt dès qu'elles sont toutes fixées.
+
+        Seules les distances des cibles sont garanties définitives dans l'arbre renvoyé.
+        """
+        indices = {self._indice(cible) for cible in cibles}
+        return self._explorer(self._indice(source), indices)
+
+    def distances_vers(self, source, cibles):
+        arbre = self.vers_cibles(source, cibles)
+        return {cible: arbre.distance(cible) for cible in cibles}
@@ -0,0 +1,185 @@
+import heapq
+import numpy as np
+from algorithms.graph.BellmanFord import CycleNegatifError, executer
+from algorithms.graph.Dinic import ReseauFlot
+from data.graph_models import MatriceCSR, index_sommets, listes_adjacence, matrice_valide
+
+
+def _potentiels_initiaux(reseau, cout, s, mode):
+    # Bellman-Ford depuis s sur les arcs d'origine, seulement si un coût est négatif ;
+    # les sommets inaccessibles gardent un potentiel nul (ils ne seront jamais atteints)
+    if all(cout[e] >= 0 for e in range(0, len(cout), 2)):
+        return [0] * reseau.n
+    adjacence = [[] for _ in range(reseau.n)]
+    for e in range(0, len(cout), 2):
+        adjacence[reseau.origine(e)].append((reseau.dest[e], cout[e]))
+    distances, _ = executer(adjacence, s, mode)
+    return [d if d != float('inf') else 0 for d in distances]
+
+
+def plus_courts_chemins_successifs(reseau, cout, s, t, demande=None, mode="standard"):
+    """Flot de coût minimum par plus courts chemins successifs.
+
+    cout[e] est le coût unitaire de l'arc e (cout[e ^ 1] = -cout[e]). Chaque
+    itération cherche le chemin résiduel le moins cher par Dijkstra sur les coûts
+    réduits c(u, v) + h[u] - h[v] >= 0 (potentiels de Johnson), arrêté dès que le
+    puits est fixé, puis l'augmente. S'arrête quand le puits est inaccessible ou
+    quand `demande` unités ont été envoyées. Retourne (flot, cout_total).
+    """
+    n = reseau.n
+    adj, dest, cap = reseau.adj, reseau.dest, reseau.cap
+    h = _potentiels_initiaux(reseau, cout, s, mode)
+    flot = 0
+    cout_total = 0
+    if s == t:
+        return flot, cout_total
+
+    while demande is None or flot < demande:
+        distances = [float('inf')] * n
+        distances[s] = 0
+        arc_parent = [-1] * n
+        fixe = [False] * n
+        heap = [(0, s)]
+        while heap:
+            dist, u = heapq.heappop(heap)
+            if fixe[u]:
+                continue
+            fixe[u] = True
+            if u == t:
+                break
+            for e in adj[u]:
+                if cap[e] > 0:
+                    v = dest[e]
+                    nouvelle = dist + cout[e] + h[u] - h[v]
+                    if nouvelle < distances[v]:
+                        distances[v] = nouvelle
+                        arc_parent[v] = e
+                        heapq.heappush(heap, (nouvelle, v))
+        if not fixe[t]:
+            break
+
+        # Mise à jour des potentiels : les sommets non fixés sont au moins aussi loin que t
+        borne = distances[t]
+        for v in range(n):
+            h[v] += distances[v] if fixe[v] else borne
+
+        path_flow = float('inf') if demande is None else demande - flot
+        v = t
+        while v != s:
+            e = arc_parent[v]
+            path_flow = min(path_flow, cap[e])
+            v = dest[e ^ 1]
+        v = t
+        while v != s:
+            e = arc_parent[v]
+            cap[e] -= path_flow
+            cap[e ^ 1] += path_flow
+            cout_total += path_flow * cout[e]
+            v = dest[e ^ 1]
+        flot += path_flow
+
+    return flot, cout_total
+
+
+def _resoudre(reseau, cout, sommets, index, source, sink, demande, sortie, mode):
+    try:
+        flot, cout_total = plus_courts_chemins_successifs(
+            reseau, cout, index[source], index[sink], demande, mode
+        )
+    except CycleNegatifError as e:
+        raise CycleNegatifError([[sommets[i] for i in cycle] for cycle in e.cycles]) from None
+    return flot, cout_total, reseau.sortie(sortie)
+
+
+def flot_cout_minimum(sommets, capacites, couts, source, sink, index=None, demande=None, sortie="dense", mode="standard"):
+    """Flot maximum de coût minimum (ou flot de `demande` unités au coût minimum).
+
+    capacites et couts sont deux matrices n×n (listes ou MatriceCSR) : l'arc
+    u -> v existe si capacites[u][v] > 0 et coûte couts[u][v] par unité (une case
+    absente du CSR des coûts vaut 0). Les coûts négatifs sont acceptés tant qu'ils
+    ne forment pas de cycle négatif (mode : moteur Bellman-Ford des potentiels).
+
+    Retourne (flot, cout_total, flow_matrix), flow_matrix au format `sortie`
+    ("dense" ou "csr") comme pour fordFulkerson.
+    """
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    if not matrice_valide(capacites, n) or not matrice_valide(couts, n):
+        raise ValueError("Matrice d'adjacence invalide")
+
+    # Coûts du CSR indexés par ligne (une case absente vaut 0)
+    couts_creux = None
+    if isinstance(couts, MatriceCSR):
+        couts_creux = [dict(voisins) for voisins in listes_adjacence(couts)]
+
+    reseau = ReseauFlot(n)
+    cout = []
+    for u, voisins in enumerate(listes_adjacence(capacites)):
+        for v, capacite in voisins:
+            if capacite > 0 and u != v:
+                reseau.ajouter_arc(u, v, capacite)
+                c = couts[u][v] if couts_creux is None else couts_creux[u].get(v, 0)
+                cout += [c, -c]
+    return _resoudre(reseau, cout, sommets, index, source, sink, demande, sortie, mode)
+
+
+def flot_cout_minimum_aretes(sommets, aretes, source, sink, index=None, demande=None, sortie="dense", mode="standard"):
+    """Même calcul que flot_cout_minimum à partir d'une liste d'arcs (u, v, capacite, cout).
+
+    Les arcs parallèles sont autorisés (leurs flots sont additionnés dans flow_matrix).
+    """
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+
+    reseau = ReseauFlot(n)
+    cout = []
+    for u, v, capacite, c in aretes:
+        if u not in index or v not in index:
+            raise ValueError(f"L'arête {u} -> {v} fait référence à un sommet inexistant")
+        if capacite > 0 and u != v:
+            reseau.ajouter_arc(index[u], index[v], capacite)
+            cout += [c, -c]
+    return _resoudre(reseau, cout, sommets, index, source, sink, demande, sortie, mode)
+
+
+def transport_optimal(costs, supply, demand):
+    """Plan de transport optimal, même contrat que moindre_cout() : (allocation, total_cost).
+
+    Modélisé comme un flot de coût minimum source -> fournisseurs -> clients -> puits,
+    où chaque fournisseur i offre supply[i] et chaque client j demande demand[j].
+    Contrairement à Vogel, au moindre coût ou au coin nord-ouest, la solution est optimale.
+    """
+    costs = np.array(costs, dtype=float)
+    m, k = costs.shape
+    if len(supply) != m or len(demand) != k:
+        raise ValueError("Les dimensions des coûts, de l'offre et de la demande ne correspondent pas")
+    s, t = m + k, m + k + 1
+
+    reseau = ReseauFlot(m + k + 2)
+    cout = []
+    for i in range(m):
+        reseau.ajouter_arc(s, i, supply[i])
+        cout += [0, 0]
+    arcs = {}
+    for i in range(m):
+        for j in range(k):
+            if costs[i, j] != np.inf:
+                arcs[(i, j)] = reseau.ajouter_arc(i, m + j, min(supply[i], demand[j]))
+                cout += [float(costs[i, j]), -float(costs[i, j])]
+    for j in range(k):
+        reseau.ajouter_arc(m + j, t, demand[j])
+        cout += [0, 0]
+
+    plus_courts_chemins_successifs(reseau, cout, s, t)
+
+    allocation = np.zeros_like(costs)
+    for (i, j), e in arcs.items():
+        allocation[i, j] = reseau.flot(e)
+    total_cost = np.sum(allocation * np.where(allocation > 0, costs, 0))
+    return allocation, total_cost
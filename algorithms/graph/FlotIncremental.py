@@ -0,0 +1,122 @@
+from algorithms.graph.Dinic import ReseauFlot, dinic_reseau
+from data.graph_models import MatriceCSR, index_sommets, listes_adjacence, matrice_valide
+
+
+def _reequilibrer(reseau, sources, puits):
+    # Achemine le déséquilibre depuis les sommets de `sources` vers ceux de `puits`
+    # ({sommet: quantité}) par un flot maximum entre une super-source et un
+    # super-puits ajoutés temporairement, puis retire ces arcs auxiliaires
+    if not sources or not puits:
+        return
+    n = reseau.n
+    super_source, super_puits = n, n + 1
+    nb_arcs = len(reseau.dest)
+    reseau.n = n + 2
+    reseau.adj += [[], []]
+    for v, quantite in sources.items():
+        reseau.ajouter_arc(super_source, v, quantite)
+    for v, quantite in puits.items():
+        reseau.ajouter_arc(v, super_puits, quantite)
+
+    dinic_reseau(reseau, super_source, super_puits)
+
+    reseau.n = n
+    del reseau.adj[n:]
+    for u in range(n):
+        reseau.adj[u] = [e for e in reseau.adj[u] if e < nb_arcs]
+    del reseau.dest[nb_arcs:], reseau.cap[nb_arcs:], reseau.capacite[nb_arcs:]
+
+
+def _desequilibres(reseau, s, t):
+    # Entrant - sortant pour chaque sommet intermédiaire
+    bilan = [0] * reseau.n
+    for e in range(0, len(reseau.dest), 2):
+        f = reseau.flot(e)
+        bilan[reseau.origine(e)] -= f
+        bilan[reseau.dest[e]] += f
+    bilan[s] = bilan[t] = 0
+    return bilan
+
+
+def flot_incremental(sommets, matrice_adj, flow_matrix, modifications, source, sink, index=None, sortie="dense"):
+    """Flot maximum après modification de capacités, à partir du flot précédent.
+
+    matrice_adj : capacités avant modification (dense ou MatriceCSR)
+    flow_matrix : flot maximum obtenu sur ces capacités (dense ou MatriceCSR)
+    modifications : liste de (u, v, delta) ; la capacité de u -> v devient
+    max(0, capacité + delta).
+
+    Le flot précédent est ramené sous les nouvelles capacités ; l'excès ainsi
+    créé en amont d'une arête réduite est d'abord renvoyé vers la source (ou
+    redirigé vers l'aval de l'arête), puis le manque en aval est repris au puits,
+    dans le graphe résiduel. Le flot redevenu valide est ensuite augmenté par
+    Dinic : seules quelques augmentations sont nécessaires après une petite
+    modification.
+
+    Retourne (max_flow, flow_matrix, capacites) où capacites est la nouvelle
+    matrice de capacités, dans le même format que matrice_adj.
+    """
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    if not matrice_valide(matrice_adj, n) or not matrice_valide(flow_matrix, n):
+        raise ValueError("Matrice d'adjacence invalide")
+    s, t = index[source], index[sink]
+
+    capacites = {}
+    for u, voisins in enumerate(listes_adjacence(matrice_adj)):
+        for v, capacite in voisins:
+            capacites[(u, v)] = capacite
+    for u, v, delta in modifications:
+        if u not in index or v not in index:
+            raise ValueError(f"L'arête {u} -> {v} fait référence à un sommet inexistant")
+        cle = (index[u], index[v])
+        capacites[cle] = max(0, capacites.get(cle, 0) + delta)
+
+    reseau = ReseauFlot(n)
+    arcs = {}
+    for (u, v), capacite in sorted(capacites.items()):
+        if capacite > 0 and u != v:
+            arcs[(u, v)] = reseau.ajouter_arc(u, v, capacite)
+
+    # Flot précédent, écrêté aux nouvelles capacités
+    for u, voisins in enumerate(listes_adjacence(flow_matrix)):
+        for v, f in voisins:
+            e = arcs.get((u, v))
+            if e is None or f <= 0:
+                continue
+            f = min(f, reseau.capacite[e])
+            reseau.cap[e] -= f
+            reseau.cap[e ^ 1] += f
+
+    # Réparation : l'excès part vers la source ou vers les sommets en manque...
+    bilan = _desequilibres(reseau, s, t)
+    exces = {v: b for v, b in enumerate(bilan) if b > 0}
+    if exces:
+        manques = {v: -b for v, b in enumerate(bilan) if b < 0}
+        manques[s] = sum(exces.values())
+        _reequilibrer(reseau, exces, manques)
+    # ... puis les manques restants sont repris depuis le puits
+    bilan = _desequilibres(reseau, s, t)
+    manques = {v: -b for v, b in enumerate(bilan) if b < 0}
+    if manques:
+        _reequilibrer(reseau, {t: sum(manques.values())}, manques)
+
+    if s != t:
+        dinic_reseau(reseau, s, t)
+    max_flow = 0
+    for e in range(0, len(reseau.dest), 2):
+        if reseau.dest[e] == t:
+            max_flow += reseau.flot(e)
+        elif reseau.origine(e) == t:
+            max_flow -= reseau.flot(e)
+
+    if isinstance(matrice_adj, MatriceCSR):
+        nouvelles = MatriceCSR.depuis_aretes(n, {cle: c for cle, c in capacites.items() if c > 0})
+    else:
+        nouvelles = [list(ligne) for ligne in matrice_adj]
+        for (u, v), capacite in capacites.items():
+            nouvelles[u][v] = capacite
+    return max_flow, reseau.sortie(sortie), nouvelles
@@ -0,0 +1,72 @@
+import numpy as np
+from data.graph_models import MatriceCSR, listes_adjacence
+
+
+def _matrice_initiale(matrice_adj, distances):
+    # Remplit distances (tableau n×n déjà alloué) ligne par ligne : poids de l'arête,
+    # inf si absente (case à 0 ou infinie), 0 sur la diagonale
+    n = len(matrice_adj)
+    if isinstance(matrice_adj, MatriceCSR):
+        for i, voisins in enumerate(listes_adjacence(matrice_adj)):
+            distances[i] = np.inf
+            for j, poids in voisins:
+                distances[i, j] = poids
+    else:
+        for i, ligne in enumerate(matrice_adj):
+            if len(ligne) != n:
+                raise ValueError("Matrice d'adjacence invalide")
+            row = np.asarray(ligne, dtype=np.float64)
+            distances[i] = np.where(row == 0, np.inf, row)
+    # Une boucle négative est conservée pour être détectée comme cycle négatif
+    diagonale = np.diagonal(distances).copy()
+    np.fill_diagonal(distances, np.minimum(diagonale, 0))
+
+
+def floyd_warshall(matrice_adj, bloc=256, fichier=None):
+    """Distances entre toutes les paires sur la matrice de MatriceAdjacence.get_graphe().
+
+    Chaque étape k est un np.minimum diffusé (ligne k + colonne k) ; les mises à
+    jour sont regroupées par blocs de `bloc` sommets (algorithme de Floyd-Warshall
+    par blocs) pour que les tuiles manipulées restent en cache.
+    fichier : chemin .npy ; la matrice est alors construite et calculée
+    directement dans un fichier projeté en mémoire (np.memmap), sans copie en RAM.
+    """
+    n = len(matrice_adj)
+    if fichier is not None:
+        distances = np.lib.format.open_memmap(fichier, mode="w+", dtype=np.float64, shape=(n, n))
+    else:
+        distances = np.empty((n, n), dtype=np.float64)
+    _matrice_initiale(matrice_adj, distances)
+
+    for kb in range(0, n, bloc):
+        ke = min(kb + bloc, n)
+
+        # Phase 1 : bloc diagonal, puis bande de lignes kb:ke sur toutes les colonnes
+        lignes = distances[kb:ke]
+        for k in range(kb, ke):
+            np.minimum(lignes, lignes[:, k, None] + lignes[k - kb, None, :], out=lignes)
+
+        # Phase 2 : bande de colonnes kb:ke sur toutes les lignes
+        colonnes = distances[:, kb:ke]
+        for k in range(kb, ke):
+            np.minimum(colonnes, colonnes[:, k - kb, None] + colonnes[k, None, :], out=colonnes)
+
+        # Phase 3 : tuiles restantes, à partir des bandes déjà terminées
+        for ib in range(0, n, bloc):
+            if ib == kb:
+                continue
+            ie = min(ib + bloc, n)
+            for jb in range(0, n, bloc):
+                if jb == kb:
+                    continue
+                je = min(jb + bloc, n)
+                tuile = distances[ib:ie, jb:je]
+                for k in range(kb, ke):
+                    np.minimum(tuile, distances[ib:ie, k, None] + distances[k, None, jb:je], out=tuile)
+
+    if (np.diagonal(distances) < 0).any():
+        raise ValueError("Le graphe contient un cycle de poids négatif")
+
+    if isinstance(distances, np.memmap):
+        distances.flush()
+    return distances
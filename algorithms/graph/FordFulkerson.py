@@ -1,13 +1,33 @@
-def fordFulkerson(sommets, matrice_adj, source, sink):
+from collections import deque
+from algorithms.graph.Dinic import dinic
+from algorithms.graph.PushRelabel import push_relabel
+from data.graph_models import MatriceCSR, index_sommets, listes_adjacence
+
+
+def fordFulkerson(sommets, matrice_adj, source, sink, index=None, coupe=False):
     # Create residual graph and flow matrix
     n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    source_idx = index[source]
+    sink_idx = index[sink]
     flow_matrix = [[0] * n for _ in range(n)]
-    residual_graph = [[0] * n for _ in range(n)]
 
-    # Initialize residual graph with capacities
-    for i in range(n):
-        for j in range(n):
-            residual_graph[i][j] = matrice_adj[i][j]
+    # Residual graph stored per vertex as {neighbour: residual capacity}.
+    # Reverse arcs are added with capacity 0 so that flow can be cancelled.
+    residual_graph = [{} for _ in range(n)]
+    adjacence = listes_adjacence(matrice_adj)
+    for u, voisins in enumerate(adjacence):
+        for v, capacite in voisins:
+            residual_graph[u][v] = capacite
+    for u in range(n):
+        for v in list(residual_graph[u]):
+            residual_graph[v].setdefault(u, 0)
+
+    # Neighbours sorted so the BFS explores them in the same order as a matrix scan
+    voisins_residuels = [sorted(residual_graph[u]) for u in range(n)]
 
     parent = [-1] * n
     max_flow = 0
@@ -15,14 +35,14 @@ def fordFulkerson(sommets, matrice_adj, source, sink):
     # BFS to find augmenting paths
     def bfs(residual_graph, s, t, parent):
         visited = [False] * n
-        queue = []
+        queue = deque()
         queue.append(s)
         visited[s] = True
 
         while queue:
-            u = queue.pop(0)
+            u = queue.popleft()
 
-            for v in range(n):
+            for v in voisins_residuels[u]:
                 if not visited[v] and residual_graph[u][v] > 0:
                     visited[v] = True
                     parent[v] = u
@@ -32,24 +52,86 @@ def fordFulkerson(sommets, matrice_adj, source, sink):
         return False
 
     # Find maximum flow
-    while bfs(residual_graph, sommets.index(source), sommets.index(sink), parent):
+    while bfs(residual_graph, source_idx, sink_idx, parent):
         path_flow = float("Inf")
-        s = sommets.index(sink)
+        s = sink_idx
 
         # Find minimum residual capacity along the path
-        while s != sommets.index(source):
+        while s != source_idx:
             path_flow = min(path_flow, residual_graph[parent[s]][s])
             s = parent[s]
 
         # Update residual capacities and flow matrix
-        v = sommets.index(sink)
-        while v != sommets.index(source):
+        v = sink_idx
+        while v != source_idx:
             u = parent[v]
             residual_graph[u][v] -= path_flow
             residual_graph[v][u] += path_flow
-            flow_matrix[u][v] += path_flow
+            # Le flot de v vers u est annulé d'abord : flow_matrix reste un flot net
+            annule = min(path_flow, flow_matrix[v][u])
+            flow_matrix[v][u] -= annule
+            flow_matrix[u][v] += path_flow - annule
             v = u
 
         max_flow += path_flow
 
+    if coupe:
+        # Sommets encore atteignables dans le graphe résiduel final : côté source de la coupe
+        atteint = [False] * n
+        atteint[source_idx] = True
+        queue = deque([source_idx])
+        while queue:
+            u = queue.popleft()
+            for v in voisins_residuels[u]:
+                if not atteint[v] and residual_graph[u][v] > 0:
+                    atteint[v] = True
+                    queue.append(v)
+        aretes = [
+            (sommets[u], sommets[v], capacite)
+            for u, voisins in enumerate(adjacence) if atteint[u]
+            for v, capacite in voisins if not atteint[v]
+        ]
+        return max_flow, flow_matrix, {
+            "cote_source": [sommets[u] for u in range(n) if atteint[u]],
+            "aretes": aretes,
+            "capacite": sum(c for _, _, c in aretes),
+        }
     return max_flow, flow_matrix
+
+
+MOTEURS = ("edmonds_karp", "dinic", "push_relabel", "auto")
+
+# Au-delà de cette densité (arcs / n(n-1)), le push-relabel devient plus rapide que Dinic
+SEUIL_DENSITE = 0.1
+
+
+def choisir_moteur(matrice_adj):
+    n = len(matrice_adj)
+    if n < 2:
+        return "dinic"
+    if isinstance(matrice_adj, MatriceCSR):
+        nb_arcs = matrice_adj.nombre_aretes()
+    else:
+        nb_arcs = sum(1 for ligne in matrice_adj for c in ligne if c > 0)
+    densite = nb_arcs / (n * (n - 1))
+    return "push_relabel" if densite >= SEUIL_DENSITE else "dinic"
+
+
+def flot_maximum(sommets, matrice_adj, source, sink, moteur="auto", index=None, sortie="dense", coupe=False):
+    # Point d'entrée commun des moteurs de flot, choisis par leur nom ;
+    # "auto" choisit entre Dinic et push-relabel selon la densité du réseau.
+    # coupe=True ajoute la coupe minimale en troisième élément :
+    # {"cote_source": [...], "aretes": [(u, v, capacité)], "capacite": total}
+    if moteur not in MOTEURS:
+        raise ValueError(f"Le moteur doit être l'un de {', '.join(MOTEURS)}")
+    if moteur == "auto":
+        moteur = choisir_moteur(matrice_adj)
+    if moteur == "dinic":
+        return dinic(sommets, matrice_adj, source, sink, index, sortie, coupe)
+    if moteur == "push_relabel":
+        return push_relabel(sommets, matrice_adj, source, sink, index, sortie, coupe)
+
+    resultat = fordFulkerson(sommets, matrice_adj, source, sink, index, coupe)
+    if sortie == "csr":
+        return (resultat[0], MatriceCSR.depuis_dense(resultat[1])) + resultat[2:]
+    return resultat
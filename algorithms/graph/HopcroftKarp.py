@@ -0,0 +1,150 @@
+from collections import deque
+from data.graph_models import listes_adjacence
+
+# Marque « pas de partenaire » dans les tableaux de couplage
+LIBRE = -1
+
+
+def _couplage_indices(n_gauche, n_droite, voisins):
+    """Hopcroft-Karp sur les indices, en O(E√V).
+
+    voisins[u] : sommets de droite adjacents au sommet u de gauche.
+    Chaque phase construit par BFS les couches de chemins alternés les plus
+    courts depuis les sommets libres de gauche, puis les augmente tous par DFS
+    (itérative, avec pointeur d'arc courant) : il y a au plus O(√V) phases.
+    Retourne (partenaire_gauche, partenaire_droite).
+    """
+    partenaire_gauche = [LIBRE] * n_gauche
+    partenaire_droite = [LIBRE] * n_droite
+    infini = float('inf')
+
+    while True:
+        # BFS : couche de chaque sommet de gauche
+        couche = [infini] * n_gauche
+        file = deque()
+        for u in range(n_gauche):
+            if partenaire_gauche[u] == LIBRE:
+                couche[u] = 0
+                file.append(u)
+        trouve = False
+        while file:
+            u = file.popleft()
+            for v in voisins[u]:
+                w = partenaire_droite[v]
+                if w == LIBRE:
+                    trouve = True
+                elif couche[w] == infini:
+                    couche[w] = couche[u] + 1
+                    file.append(w)
+        if not trouve:
+            return partenaire_gauche, partenaire_droite
+
+        # DFS : chemins augmentants disjoints qui suivent les couches
+        courant = [0] * n_gauche
+        for racine in range(n_gauche):
+            if partenaire_gauche[racine] != LIBRE:
+                continue
+            pile = [racine]
+            while pile:
+                u = pile[-1]
+                if courant[u] == len(voisins[u]):
+                    couche[u] = infini  # impasse pour le reste de la phase
+                    pile.pop()
+                    continue
+                v = voisins[u][courant[u]]
+                courant[u] += 1
+                w = partenaire_droite[v]
+                if w == LIBRE:
+                    # Chemin augmentant trouvé : on inverse le couplage le long de la pile
+                    for x in reversed(pile):
+                        suivant = partenaire_gauche[x]
+                        partenaire_gauche[x] = v
+                        partenaire_droite[v] = x
+                        v = suivant
+                    for x in pile:
+                        couche[x] = infini
+                    break
+                if couche[w] == couche[u] + 1:
+                    pile.append(w)
+
+
+def _couverture_konig(n_gauche, voisins, partenaire_gauche, partenaire_droite):
+    # Théorème de König : Z = sommets atteints depuis les sommets libres de gauche
+    # par chemins alternés ; couverture = (gauche \ Z) ∪ (droite ∩ Z)
+    atteint_gauche = [False] * n_gauche
+    atteint_droite = [False] * len(partenaire_droite)
+    file = deque()
+    for u in range(n_gauche):
+        if partenaire_gauche[u] == LIBRE:
+            atteint_gauche[u] = True
+            file.append(u)
+    while file:
+        u = file.popleft()
+        for v in voisins[u]:
+            if not atteint_droite[v] and partenaire_gauche[u] != v:
+                atteint_droite[v] = True
+                w = partenaire_droite[v]
+                if w != LIBRE and not atteint_gauche[w]:
+                    atteint_gauche[w] = True
+                    file.append(w)
+    return atteint_gauche, atteint_droite
+
+
+def hopcroft_karp(gauche, droite, aretes):
+    """Couplage maximum d'un graphe biparti donné par une liste d'arêtes (u, v), u à gauche, v à droite.
+
+    Retourne (couplage, couverture) : la liste des paires (u, v) couplées et une
+    couverture minimale par sommets (même taille que le couplage).
+    """
+    index_gauche = {}
+    for u in gauche:
+        index_gauche.setdefault(u, len(index_gauche))
+    index_droite = {}
+    for v in droite:
+        index_droite.setdefault(v, len(index_droite))
+    gauche = list(index_gauche)
+    droite = list(index_droite)
+
+    voisins = [[] for _ in gauche]
+    for u, v in aretes:
+        if u not in index_gauche or v not in index_droite:
+            raise ValueError(f"L'arête {u} - {v} ne relie pas la partie gauche à la partie droite")
+        voisins[index_gauche[u]].append(index_droite[v])
+
+    partenaire_gauche, partenaire_droite = _couplage_indices(len(gauche), len(droite), voisins)
+    couplage = [(gauche[u], droite[v]) for u, v in enumerate(partenaire_gauche) if v != LIBRE]
+
+    atteint_gauche, atteint_droite = _couverture_konig(len(gauche), voisins, partenaire_gauche, partenaire_droite)
+    couverture = [u for i, u in enumerate(gauche) if not atteint_gauche[i]]
+    couverture += [v for j, v in enumerate(droite) if atteint_droite[j]]
+    return couplage, couverture
+
+
+def couplage_biparti(graphe, partition):
+    """Couplage maximum d'un MatriceAdjacence (dense ou CSR) dont `partition` est la partie gauche.
+
+    Les autres sommets forment la partie droite ; une arête à l'intérieur d'une
+    même partie lève ValueError. Même retour que hopcroft_karp.
+    """
+    donnees = graphe.get_graphe()
+    sommets = donnees["sommets"]
+    partition = set(partition)
+    if not partition <= set(sommets):
+        raise ValueError("La partition contient des sommets absents du graphe")
+    gauche = [s for s in sommets if s in partition]
+    droite = [s for s in sommets if s not in partition]
+
+    aretes = []
+    for i, voisins in enumerate(listes_adjacence(donnees["matrice"])):
+        u = sommets[i]
+        for j, _ in voisins:
+            v = sommets[j]
+            if (u in partition) == (v in partition):
+                raise ValueError(f"L'arête {u} - {v} relie deux sommets de la même partie")
+            if u in partition:
+                aretes.append((u, v))
+            elif donnees["oriente"]:
+                aretes.append((v, u))
+    if donnees["oriente"]:
+        aretes = list(dict.fromkeys(aretes))
+    return hopcroft_karp(gauche, droite, aretes)
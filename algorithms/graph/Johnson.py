@@ -0,0 +1,125 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algorithms.graph.BellmanFord import CycleNegatifError, executer
+from data.graph_models import index_sommets, listes_adjacence, matrice_valide
+
+# En dessous de ce nombre de sommets, le démarrage des processus (plusieurs dizaines
+# de ms) coûte plus que les Dijkstra eux-mêmes : processus=None calcule alors en séquentiel
+SEUIL_PARALLELE = 300
+
+# Graphe repondéré partagé par les processus de calcul (fixé par _initialiser_processus)
+_adjacence = None
+
+
+def _initialiser_processus(adjacence):
+    global _adjacence
+    _adjacence = adjacence
+
+
+def _dijkstra_source(source):
+    # Dijkstra depuis source sur le graphe repondéré (poids tous >= 0)
+    n = len(_adjacence)
+    distances = [float('inf')] * n
+    distances[source] = 0
+    predecesseurs = [-1] * n
+    heap = [(0, source)]
+    while heap:
+        dist, u = heapq.heappop(heap)
+        if dist > distances[u]:
+            continue
+        for v, poids in _adjacence[u]:
+            nouvelle = dist + poids
+            if nouvelle < distances[v]:
+                distances[v] = nouvelle
+                predecesseurs[v] = u
+                heapq.heappush(heap, (nouvelle, v))
+    return source, distances, predecesseurs
+
+
+def johnson(sommets, matrice_adj, processus=None, fichier=None, fichier_predecesseurs=None, mode="standard"):
+    """Plus courts chemins entre toutes les paires, poids négatifs autorisés.
+
+    Un Bellman-Ford (mode : "standard", "spfa" ou "vectorise") depuis une source
+    virtuelle donne les potentiels h ; chaque arête u -> v est repondérée en
+    w + h[u] - h[v] >= 0, puis un Dijkstra est lancé depuis chaque sommet,
+    réparti sur `processus` processus (1 : calcul séquentiel dans le processus courant ;
+    None : un processus par cœur à partir de SEUIL_PARALLELE sommets, séquentiel en dessous).
+
+    Retourne (distances, predecesseurs) : matrice NumPy n×n de distances (inf si
+    inaccessible) et matrice compacte des prédécesseurs (int32, -1 si aucun), où
+    predecesseurs[s][v] est le sommet précédant v sur le chemin depuis s.
+    fichier / fichier_predecesseurs : chemins .npy pour écrire les matrices en
+    mémoire projetée (np.memmap) au lieu de les garder en RAM.
+    """
+    n = len(sommets)
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+    adjacence = listes_adjacence(matrice_adj)
+
+    # Potentiels de Johnson
+    try:
+        h, _ = executer(adjacence, None, mode)
+    except CycleNegatifError as e:
+        raise CycleNegatifError([[sommets[i] for i in cycle] for cycle in e.cycles]) from None
+
+    # Repondération (max avec 0 pour absorber les erreurs d'arrondi flottant)
+    repondere = [
+        [(v, max(0, poids + h[u] - h[v])) for v, poids in voisins]
+        for u, voisins in enumerate(adjacence)
+    ]
+
+    if fichier is not None:
+        distances = np.lib.format.open_memmap(fichier, mode="w+", dtype=np.float64, shape=(n, n))
+    else:
+        distances = np.empty((n, n), dtype=np.float64)
+    type_pred = np.int32 if n < 2 ** 31 else np.int64
+    if fichier_predecesseurs is not None:
+        predecesseurs = np.lib.format.open_memmap(fichier_predecesseurs, mode="w+", dtype=type_pred, shape=(n, n))
+    else:
+        predecesseurs = np.empty((n, n), dtype=type_pred)
+
+    potentiels = np.array(h, dtype=np.float64)
+
+    def enregistrer(source, dist, pred):
+        # Retour aux poids d'origine : d(s, v) = d'(s, v) - h[s] + h[v]
+        distances[source] = np.array(dist, dtype=np.float64) - potentiels[source] + potentiels
+        predecesseurs[source] = pred
+
+    if processus is None:
+        processus = (os.cpu_count() or 1) if n >= SEUIL_PARALLELE else 1
+    if processus <= 1 or n < 2:
+        _initialiser_processus(repondere)
+        for source in range(n):
+            enregistrer(*_dijkstra_source(source))
+        _initialiser_processus(None)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processus, initializer=_initialiser_processus, initargs=(repondere,)
+        ) as pool:
+            taille = max(1, n // (processus * 4))
+            for resultat in pool.map(_dijkstra_source, range(n), chunksize=taille):
+                enregistrer(*resultat)
+
+    if isinstance(distances, np.memmap):
+        distances.flush()
+    if isinstance(predecesseurs, np.memmap):
+        predecesseurs.flush()
+    return distances, predecesseurs
+
+
+def chemin_johnson(sommets, predecesseurs, debut, fin, index=None):
+    # Reconstruit le chemin debut -> fin à partir de la matrice des prédécesseurs
+    if index is None:
+        index = index_sommets(sommets)
+    s, current = index[debut], index[fin]
+    if s != current and predecesseurs[s][current] == -1:
+        return []
+    chemin = []
+    while current != -1:
+        chemin.append(sommets[current])
+        if current == s:
+            break
+        current = int(predecesseurs[s][current])
+    return chemin[::-1]
@@ -1,4 +1,243 @@
-def kruskal(sommets, matrice_adjacence):
+import csv
+import heapq
+import itertools
+import os
+import tempfile
+import numpy as np
+from algorithms.graph.Prim import prim_dense, prim_tas
+from data.graph_models import MatriceCSR, listes_adjacence
+
+
+class UnionFind:
+    # Union-find sur tableaux d'entiers (sommets numérotés 0..n-1) :
+    # union par rang et recherche itérative par division de chemin (path halving),
+    # donc sans récursion quelle que soit la longueur des chaînes
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rang = [0] * n
+
+    def trouver(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def unir(self, a, b):
+        # Retourne False si a et b étaient déjà dans le même composant
+        ra, rb = self.trouver(a), self.trouver(b)
+        if ra == rb:
+            return False
+        if self.rang[ra] < self.rang[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rang[ra] == self.rang[rb]:
+            self.rang[ra] += 1
+        return True
+
+
+def aretes_ponderees(matrice_adjacence):
+    """Arêtes (src, dst, poids) en tableaux NumPy, dans l'ordre de parcours ligne par ligne.
+
+    Seuls les poids > 0 et finis sont retenus. Pour chaque paire symétrique
+    (i, j) / (j, i) de même poids, seule la copie i < j est gardée : l'autre ne
+    peut jamais entrer dans l'arbre couvrant, elle est rejetée après la première.
+    poids est en float64 ; valeurs_origine() redonne les valeurs exactes de la matrice.
+    """
+    n = len(matrice_adjacence)
+    if isinstance(matrice_adjacence, MatriceCSR):
+        src = np.repeat(np.arange(n, dtype=np.int64), np.diff(matrice_adjacence.indptr))
+        dst = np.asarray(matrice_adjacence.indices, dtype=np.int64)
+        valeurs = np.asarray(matrice_adjacence.weights, dtype=np.float64)
+        garde = (valeurs > 0) & np.isfinite(valeurs)
+        if len(valeurs):
+            # Arête miroir (j, i) de même poids, cherchée dans les clés triées i * n + j
+            cles = src * n + dst
+            position = np.minimum(np.searchsorted(cles, dst * n + src), len(cles) - 1)
+            miroir = (cles[position] == dst * n + src) & (valeurs[position] == valeurs)
+            garde &= ~((src > dst) & miroir)
+        return src[garde], dst[garde], valeurs[garde]
+
+    dense = np.array(matrice_adjacence, dtype=np.float64).reshape(n, n)
+    garde = (dense > 0) & np.isfinite(dense)
+    garde &= ~(np.tril(np.ones((n, n), dtype=bool), k=-1) & (dense == dense.T))
+    src, dst = np.nonzero(garde)
+    return src, dst, dense[garde]
+
+
+def valeurs_origine(matrice_adjacence, src, dst):
+    # Poids des arêtes src[k] -> dst[k] tels qu'ils sont stockés (un int reste un int)
+    src, dst = np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+    if isinstance(matrice_adjacence, MatriceCSR):
+        n = len(matrice_adjacence)
+        lignes = np.repeat(np.arange(n, dtype=np.int64), np.diff(matrice_adjacence.indptr))
+        cles = lignes * n + np.asarray(matrice_adjacence.indices, dtype=np.int64)
+        return np.asarray(matrice_adjacence.weights)[np.searchsorted(cles, src * n + dst)].tolist()
+    return [matrice_adjacence[i][j] for i, j in zip(src.tolist(), dst.tolist())]
+
+
+def kruskal_tableaux(sommets, matrice_adjacence):
+    # Kruskal sur tableaux : arêtes i < j extraites et triées par NumPy (tri stable,
+    # donc même ordre que le tri Python pour les poids égaux), union-find sur indices
+    n = len(sommets)
+    src, dst, poids = aretes_ponderees(matrice_adjacence)
+    ordre = np.argsort(poids, kind="stable").tolist()
+    src, dst = src.tolist(), dst.tolist()
+
+    composants = UnionFind(n)
+    retenues = []
+    for k in ordre:
+        if composants.unir(src[k], dst[k]):
+            retenues.append(k)
+            if len(retenues) == n - 1:
+                break
+    src = [src[k] for k in retenues]
+    dst = [dst[k] for k in retenues]
+    poids = valeurs_origine(matrice_adjacence, src, dst)
+    return [(sommets[i], sommets[j], w) for i, j, w in zip(src, dst, poids)]
+
+
+def boruvka(sommets, matrice_adjacence):
+    """Borůvka vectorisé : même arbre couvrant, et même liste, que kruskal.
+
+    À chaque tour, chaque composant choisit son arête sortante la moins chère par
+    minimum groupé NumPy (np.minimum.at), puis les composants sont contractés par
+    sauts de pointeurs ; les arêtes devenues internes sont éliminées. Il y a au
+    plus log2(V) tours et aucun tri global des arêtes. Les égalités de poids sont
+    départagées par la position de l'arête dans l'ordre de parcours : c'est
+    l'ordre total du tri stable de Kruskal, l'arbre obtenu est donc le même.
+    """
+    n = len(sommets)
+    src_origine, dst_origine, poids_origine = aretes_ponderees(matrice_adjacence)
+    src, dst, poids = src_origine, dst_origine, poids_origine
+    rang = np.arange(len(poids), dtype=np.int64)  # position d'origine de chaque arête
+    composant = np.arange(n, dtype=np.int64)
+    choisies = []
+
+    while len(poids):
+        cu, cv = composant[src], composant[dst]
+        externe = cu != cv
+        src, dst, poids, rang, cu, cv = src[externe], dst[externe], poids[externe], rang[externe], cu[externe], cv[externe]
+        if not len(poids):
+            break
+
+        # Arête sortante minimale de chaque composant, par ses deux extrémités :
+        # plus petit poids, puis plus petite position (le filtrage conserve l'ordre)
+        minimum = np.full(n, np.inf)
+        np.minimum.at(minimum, cu, poids)
+        np.minimum.at(minimum, cv, poids)
+        meilleure = np.full(n, len(poids), dtype=np.int64)
+        candidates = np.flatnonzero(poids == minimum[cu])
+        np.minimum.at(meilleure, cu[candidates], candidates)
+        candidates = np.flatnonzero(poids == minimum[cv])
+        np.minimum.at(meilleure, cv[candidates], candidates)
+
+        actifs = np.flatnonzero(minimum < np.inf)
+        aretes = meilleure[actifs]
+        choisies.append(rang[np.unique(aretes)])
+
+        # Contraction : chaque composant pointe vers l'autre extrémité de son arête ;
+        # les paires qui se désignent mutuellement gardent le plus petit comme racine
+        cible = np.arange(n, dtype=np.int64)
+        cible[actifs] = np.where(cu[aretes] == actifs, cv[aretes], cu[aretes])
+        mutuel = (cible[cible] == np.arange(n)) & (np.arange(n) < cible)
+        cible[mutuel] = np.flatnonzero(mutuel)
+        while True:
+            suivant = cible[cible]
+            if np.array_equal(suivant, cible):
+                break
+            cible = suivant
+        composant = cible[composant]
+
+    if not choisies:
+        return []
+    retenues = np.concatenate(choisies)
+    retenues = retenues[np.lexsort((retenues, poids_origine[retenues]))]
+    src, dst = src_origine[retenues], dst_origine[retenues]
+    poids = valeurs_origine(matrice_adjacence, src, dst)
+    return [(sommets[i], sommets[j], w) for i, j, w in zip(src.tolist(), dst.tolist(), poids)]
+
+
+# Enregistrement d'une arête dans les fichiers temporaires triés
+ARETE_BINAIRE = np.dtype([("poids", np.float64), ("src", np.int64), ("dst", np.int64)])
+
+
+def _lire_run(chemin, taille_lecture):
+    # Relit un fichier trié par blocs : seul un bloc par fichier est en mémoire
+    with open(chemin, "rb") as f:
+        while True:
+            bloc = np.fromfile(f, dtype=ARETE_BINAIRE, count=taille_lecture)
+            if not len(bloc):
+                return
+            yield from zip(bloc["poids"].tolist(), bloc["src"].tolist(), bloc["dst"].tolist())
+
+
+def kruskal_externe(chemin_fichier, taille_bloc=1_000_000, dossier_temporaire=None):
+    """Kruskal en mémoire externe sur un fichier CSV d'arêtes « sommet1,sommet2,poids ».
+
+    Le fichier (format de test/Graph/Kruskal_CSV.csv) est lu par blocs de
+    taille_bloc lignes ; chaque bloc est trié par poids (tri stable NumPy) et
+    écrit dans un fichier binaire temporaire. Les fichiers sont ensuite
+    fusionnés (k-way merge, heapq.merge) et les arêtes consommées dans l'ordre
+    par l'union-find sur tableaux. La mémoire utilisée est O(V + taille_bloc),
+    indépendante du nombre d'arêtes. Retourne [(u, v, poids)] comme kruskal,
+    les égalités de poids étant départagées par l'ordre du fichier. Les poids
+    sont des entiers si tous ceux du fichier le sont, des réels sinon.
+    """
+    index = {}
+    sommets = []
+    runs = []
+    entiers = True
+    with tempfile.TemporaryDirectory(dir=dossier_temporaire) as dossier:
+        with open(chemin_fichier, newline="", encoding="utf-8") as fichier:
+            lignes = (ligne for ligne in csv.reader(fichier) if len(ligne) >= 3)
+            while True:
+                bloc = list(itertools.islice(lignes, taille_bloc))
+                if not bloc:
+                    break
+                for ligne in bloc:
+                    for sommet in ligne[:2]:
+                        if sommet not in index:
+                            index[sommet] = len(sommets)
+                            sommets.append(sommet)
+                aretes = np.empty(len(bloc), dtype=ARETE_BINAIRE)
+                aretes["poids"] = [float(ligne[2]) for ligne in bloc]
+                aretes["src"] = [index[ligne[0]] for ligne in bloc]
+                aretes["dst"] = [index[ligne[1]] for ligne in bloc]
+                del bloc
+                garde = (aretes["poids"] > 0) & np.isfinite(aretes["poids"]) & (aretes["src"] != aretes["dst"])
+                aretes = aretes[garde]
+                entiers = entiers and bool(np.all(aretes["poids"] == np.floor(aretes["poids"])))
+                aretes = aretes[np.argsort(aretes["poids"], kind="stable")]
+                chemin_run = os.path.join(dossier, f"run_{len(runs)}.bin")
+                aretes.tofile(chemin_run)
+                runs.append(chemin_run)
+                del aretes
+
+        n = len(sommets)
+        composants = UnionFind(n)
+        mst = []
+        # heapq.merge est stable : à poids égal, les runs (donc le fichier) gardent leur ordre
+        taille_lecture = max(1, taille_bloc // max(len(runs), 1))
+        flux = heapq.merge(*(_lire_run(chemin, taille_lecture) for chemin in runs), key=lambda arete: arete[0])
+        for poids, i, j in flux:
+            if composants.unir(i, j):
+                mst.append((sommets[i], sommets[j], int(poids) if entiers else poids))
+                if len(mst) == n - 1:
+                    break
+        flux.close()
+    return mst
+
+
+MODES = ("standard", "tableaux")
+
+
+def kruskal(sommets, matrice_adjacence, mode="standard"):
+    if mode not in MODES:
+        raise ValueError(f"Le mode doit être l'un de {', '.join(MODES)}")
+    if mode == "tableaux":
+        return kruskal_tableaux(sommets, matrice_adjacence)
 
     # Fonction pour trouver la racine d'un sommet avec compression de chemin
     def find(parent, sommet):
@@ -27,10 +266,10 @@ def kruskal(sommets, matrice_adjacence):
 
     # Créer une liste d'arêtes avec leurs poids
     edges = []
-    for i in range(len(sommets)):
-        for j in range(len(sommets)):
-            if matrice_adjacence[i][j] > 0:  # Seulement les arêtes avec poids
-                edges.append((sommets[i], sommets[j], matrice_adjacence[i][j]))
+    for i, voisins in enumerate(listes_adjacence(matrice_adjacence)):
+        for j, poids in voisins:
+            if poids > 0:  # Seulement les arêtes avec poids
+                edges.append((sommets[i], sommets[j], poids))
 
     # Trier les arêtes par poids croissant
     edges.sort(key=lambda x: x[2])
@@ -43,3 +282,43 @@ def kruskal(sommets, matrice_adjacence):
             mst.append((sommet1, sommet2, poids))
 
     return mst
+
+
+MOTEURS = ("kruskal", "boruvka", "prim_dense", "prim_tas", "auto")
+
+# Au-delà de cette densité (arcs / n(n-1)), le Prim en O(V²) devient plus rapide que Kruskal
+SEUIL_DENSITE = 0.25
+
+
+def densite(matrice_adjacence):
+    n = len(matrice_adjacence)
+    if n < 2:
+        return 0.0
+    if isinstance(matrice_adjacence, MatriceCSR):
+        nb_arcs = matrice_adjacence.nombre_aretes()
+    else:
+        dense = np.array(matrice_adjacence, dtype=np.float64).reshape(n, n)
+        nb_arcs = int(np.count_nonzero((dense > 0) & np.isfinite(dense)))
+    return nb_arcs / (n * (n - 1))
+
+
+def choisir_moteur(matrice_adjacence):
+    # Prim tableau pour les graphes denses ; sinon Borůvka, sans tri global, bat le tri
+    # NumPy de Kruskal (le Prim avec tas, en Python pur, n'est choisi à aucune densité)
+    return "prim_dense" if densite(matrice_adjacence) >= SEUIL_DENSITE else "boruvka"
+
+
+def arbre_couvrant_minimum(sommets, matrice_adjacence, moteur="auto"):
+    # Point d'entrée commun des moteurs d'arbre couvrant minimum, choisis par leur nom ;
+    # "auto" délègue à choisir_moteur : Prim tableau au-delà de SEUIL_DENSITE, Borůvka en dessous
+    if moteur not in MOTEURS:
+        raise ValueError(f"Le moteur doit être l'un de {', '.join(MOTEURS)}")
+    if moteur == "auto":
+        moteur = choisir_moteur(matrice_adjacence)
+    if moteur == "prim_dense":
+        return prim_dense(sommets, matrice_adjacence)
+    if moteur == "prim_tas":
+        return prim_tas(sommets, matrice_adjacence)
+    if moteur == "boruvka":
+        return boruvka(sommets, matrice_adjacence)
+    return kruskal_tableaux(sommets, matrice_adjacence)
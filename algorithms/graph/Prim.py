@@ -0,0 +1,81 @@
+import heapq
+import numpy as np
+from data.graph_models import MatriceCSR, listes_adjacence
+
+
+def prim_dense(sommets, matrice_adjacence):
+    """Prim en O(V²) sur tableaux, adapté aux graphes denses (E ≈ V²).
+
+    Chaque étape choisit par argmin le sommet hors de l'arbre le plus proche,
+    puis met à jour les distances avec sa ligne de la matrice (np.minimum).
+    Le graphe est vu comme non orienté : le poids entre i et j est le plus
+    petit des poids (> 0 et finis) de i -> j et j -> i. Sur un graphe non
+    connexe, renvoie une forêt couvrante. Même format que kruskal : [(u, v, poids)].
+    """
+    n = len(sommets)
+    if isinstance(matrice_adjacence, MatriceCSR):
+        matrice_adjacence = matrice_adjacence.to_dense()
+    poids = np.array(matrice_adjacence, dtype=np.float64).reshape(n, n)
+    poids[~((poids > 0) & np.isfinite(poids))] = np.inf
+    # inverse[u, v] : le plus petit poids entre u et v est porté par l'arc v -> u
+    inverse = poids.T < poids
+    poids = np.minimum(poids, poids.T)
+
+    dans_arbre = np.zeros(n, dtype=bool)
+    cle = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    mst = []
+    for _ in range(n):
+        candidats = np.where(dans_arbre, np.inf, cle)
+        v = int(np.argmin(candidats))
+        if candidats[v] == np.inf:
+            # Nouveau composant : premier sommet restant, sans arête d'arrivée
+            v = int(np.argmin(dans_arbre))
+        else:
+            # Arête gardée dans le sens de la matrice, avec sa valeur d'origine
+            u = int(parent[v])
+            i, j = (v, u) if inverse[u, v] else (u, v)
+            mst.append((sommets[i], sommets[j], matrice_adjacence[i][j]))
+        dans_arbre[v] = True
+        meilleur = ~dans_arbre & (poids[v] < cle)
+        cle[meilleur] = poids[v][meilleur]
+        parent[meilleur] = v
+    return mst
+
+
+def prim_tas(sommets, matrice_adjacence):
+    """Prim avec tas binaire en O(E log V), pour les densités intermédiaires.
+
+    Travaille sur les listes d'adjacence (matrice dense ou MatriceCSR) ; une
+    arête n'entre dans le tas que si elle améliore la clé de son extrémité.
+    Mêmes conventions et même format de sortie que prim_dense.
+    """
+    n = len(sommets)
+    # voisins[x] = [(y, poids, i, j)] : arête i -> j de la matrice reliant x et y
+    voisins = [[] for _ in range(n)]
+    for i, aretes in enumerate(listes_adjacence(matrice_adjacence)):
+        for j, w in aretes:
+            if w > 0 and i != j:
+                voisins[i].append((j, w, i, j))
+                voisins[j].append((i, w, i, j))
+
+    infini = float('inf')
+    cle = [infini] * n
+    dans_arbre = [False] * n
+    mst = []
+    for racine in range(n):
+        if dans_arbre[racine]:
+            continue
+        tas = [(0, racine, -1, -1)]
+        while tas:
+            w, x, i, j = heapq.heappop(tas)
+            if dans_arbre[x]:
+                continue
+            dans_arbre[x] = True
+            if i >= 0:
+                mst.append((sommets[i], sommets[j], w))
+            for y, poids, a, b in voisins[x]:
+                if poids < cle[y] and not dans_arbre[y]:
+                    cle[y] = poids
+                    heapq.heappush(tas, (poids, y, a, b))
+    return mst
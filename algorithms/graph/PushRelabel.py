@@ -0,0 +1,155 @@
+from collections import deque
+from algorithms.graph.Dinic import ReseauFlot, coupe_minimale
+from data.graph_models import index_sommets, matrice_valide
+
+
+def push_relabel_reseau(reseau, s, t):
+    """Préflot par étiquette la plus haute (highest-label push-relabel).
+
+    Heuristiques : réétiquetage global (BFS inverse depuis le puits, puis depuis
+    la source pour les sommets qui ne l'atteignent plus) toutes les n
+    réétiquetages, et trou (gap) : quand plus aucun sommet n'a la hauteur k < n,
+    les sommets au-dessus ne peuvent plus atteindre le puits et sont remontés à n + 1.
+    L'excès restant est ensuite renvoyé vers la source, si bien que le préflot
+    final est un flot valide. Retourne la valeur du flot maximum.
+    """
+    n = reseau.n
+    if s == t:
+        return 0
+    adj, dest, cap = reseau.adj, reseau.dest, reseau.cap
+    hauteur = [0] * n
+    exces = [0] * n
+    courant = [0] * n
+    limite = 2 * n
+
+    # Saturation des arcs sortant de la source
+    for e in adj[s]:
+        c = cap[e]
+        if c > 0:
+            cap[e] -= c
+            cap[e ^ 1] += c
+            exces[dest[e]] += c
+            exces[s] -= c
+
+    actifs = [[] for _ in range(limite + 1)]  # sommets actifs par hauteur
+    dans_actifs = [False] * n                 # u est-il rangé dans actifs[hauteur[u]] ?
+    effectif = [0] * (limite + 1)             # nombre de sommets par hauteur
+    plus_haut = 0  # plus haute hauteur pouvant contenir un sommet actif
+
+    def ranger():
+        # Reconstruit les compartiments après une modification globale des hauteurs
+        nonlocal plus_haut
+        for liste in actifs:
+            liste.clear()
+        for k in range(limite + 1):
+            effectif[k] = 0
+        plus_haut = 0
+        for v in range(n):
+            effectif[hauteur[v]] += 1
+            dans_actifs[v] = v != s and v != t and exces[v] > 0 and hauteur[v] < limite
+            if dans_actifs[v]:
+                actifs[hauteur[v]].append(v)
+                plus_haut = max(plus_haut, hauteur[v])
+
+    def reetiquetage_global():
+        for v in range(n):
+            hauteur[v] = limite
+            courant[v] = 0
+        for racine, base in ((t, 0), (s, n)):
+            hauteur[racine] = base
+            file = deque([racine])
+            while file:
+                u = file.popleft()
+                for e in adj[u]:
+                    v = dest[e]
+                    # arc résiduel v -> u : l'arc retour de e
+                    if hauteur[v] == limite and cap[e ^ 1] > 0 and v != s and v != t:
+                        hauteur[v] = hauteur[u] + 1
+                        file.append(v)
+        ranger()
+
+    def trou(k):
+        # Plus aucun sommet à la hauteur k < n : ceux situés entre k et n sont déconnectés du puits
+        for v in range(n):
+            if k < hauteur[v] < n:
+                hauteur[v] = n + 1
+                courant[v] = 0
+        ranger()
+
+    reetiquetage_global()
+    reetiquetages = 0
+
+    while plus_haut >= 0:
+        if not actifs[plus_haut]:
+            plus_haut -= 1
+            continue
+        u = actifs[plus_haut].pop()
+        dans_actifs[u] = False
+
+        # Décharge de u
+        while exces[u] > 0:
+            if courant[u] == len(adj[u]):
+                # Réétiquetage : juste au-dessus du plus bas voisin résiduel
+                ancienne = hauteur[u]
+                nouvelle = limite
+                for e in adj[u]:
+                    if cap[e] > 0:
+                        nouvelle = min(nouvelle, hauteur[dest[e]] + 1)
+                effectif[ancienne] -= 1
+                hauteur[u] = nouvelle
+                effectif[nouvelle] += 1
+                courant[u] = 0
+                reetiquetages += 1
+                if ancienne < n and effectif[ancienne] == 0:
+                    trou(ancienne)
+                    break
+                if reetiquetages >= n:
+                    reetiquetages = 0
+                    reetiquetage_global()
+                    break
+                if hauteur[u] >= limite:
+                    break
+                continue
+
+            e = adj[u][courant[u]]
+            v = dest[e]
+            if cap[e] > 0 and hauteur[u] == hauteur[v] + 1:
+                d = min(exces[u], cap[e])
+                cap[e] -= d
+                cap[e ^ 1] += d
+                exces[u] -= d
+                if not dans_actifs[v] and v != s and v != t:
+                    actifs[hauteur[v]].append(v)
+                    dans_actifs[v] = True
+                    plus_haut = max(plus_haut, hauteur[v])
+                exces[v] += d
+            else:
+                courant[u] += 1
+        else:
+            continue
+
+        # Hauteurs modifiées (trou ou réétiquetage global) : u est déjà rangé par ranger(),
+        # sinon il est remis dans son compartiment s'il reste actif
+        if exces[u] > 0 and hauteur[u] < limite and not dans_actifs[u]:
+            actifs[hauteur[u]].append(u)
+            dans_actifs[u] = True
+            plus_haut = max(plus_haut, hauteur[u])
+
+    return exces[t]
+
+
+def push_relabel(sommets, matrice_adj, source, sink, index=None, sortie="dense", coupe=False):
+    """Flot maximum par push-relabel ; même contrat que dinic() et fordFulkerson()"""
+    n = len(sommets)
+    if index is None:
+        index = index_sommets(sommets)
+    if source not in index or sink not in index:
+        raise ValueError("La source ou le puits n'existe pas")
+    if not matrice_valide(matrice_adj, n):
+        raise ValueError("Matrice d'adjacence invalide")
+
+    reseau = ReseauFlot.depuis_matrice(matrice_adj)
+    max_flow = push_relabel_reseau(reseau, index[source], index[sink])
+    if coupe:
+        return max_flow, reseau.sortie(sortie), coupe_minimale(reseau, index[source], sommets)
+    return max_flow, reseau.sortie(sortie)
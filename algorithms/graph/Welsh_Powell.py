@@ -1,55 +1,109 @@
-import random
+import colorsys
+import heapq
+from data.graph_models import listes_adjacence
+
+# Palette fixe : l'identifiant de couleur k donne toujours la même couleur RGB (0..1)
+PALETTE = [
+    (0.122, 0.467, 0.706), (1.000, 0.498, 0.055), (0.173, 0.627, 0.173),
+    (0.839, 0.153, 0.157), (0.580, 0.404, 0.741), (0.549, 0.337, 0.294),
+    (0.890, 0.467, 0.761), (0.498, 0.498, 0.498), (0.737, 0.741, 0.133),
+    (0.090, 0.745, 0.812),
+]
+
+
+def couleur(identifiant):
+    # Au-delà de la palette, teintes espacées par le nombre d'or (déterministes et distinctes)
+    if identifiant < len(PALETTE):
+        return PALETTE[identifiant]
+    teinte = (identifiant * 0.618033988749895) % 1.0
+    return tuple(round(c, 3) for c in colorsys.hsv_to_rgb(teinte, 0.65, 0.85))
+
 
 def Welsh_Powell(sommets, matrice_adjacence):
+    """Coloration de Welsh-Powell en O(V + E), reproductible.
+
+    Traiter les classes de couleur une à une dans l'ordre des degrés décroissants
+    revient à donner à chaque sommet, dans cet ordre, la plus petite couleur
+    absente de ses voisins déjà colorés. Les couleurs interdites d'un sommet
+    forment un masque de bits (entier Python) ; la plus petite couleur libre
+    est le bit nul le plus bas du masque. Retourne [(indice, couleur RGB)],
+    la couleur venant de la palette fixe (couleur(identifiant)).
+    """
+    n = len(sommets)
+    voisins = [[j for j, poids in ligne if poids > 0] for ligne in listes_adjacence(matrice_adjacence)]
+
+    # Degré décroissant ; tri stable, à degré égal l'ordre des sommets est conservé
+    ordre_sommets = sorted(range(n), key=lambda i: len(voisins[i]), reverse=True)
+
+    identifiants = [-1] * n
+    for idx in ordre_sommets:
+        interdites = 0
+        for voisin in voisins[idx]:
+            if identifiants[voisin] >= 0:
+                interdites |= 1 << identifiants[voisin]
+        # Plus bas bit nul du masque
+        identifiants[idx] = (~interdites & (interdites + 1)).bit_length() - 1
+
+    return [(i, couleur(identifiants[i])) for i in range(n)]
+
+
+def dsatur(sommets, matrice_adjacence):
+    """Coloration DSatur : on colore d'abord le sommet le plus saturé.
+
+    La saturation d'un sommet est le nombre de couleurs distinctes parmi ses
+    voisins ; à saturation égale, le plus haut degré l'emporte. Les sommets non
+    colorés sont rangés dans des compartiments par saturation, chacun étant un
+    tas (degré, indice) à entrées paresseuses : chaque choix et chaque mise à
+    jour coûtent O(log V). Même format de sortie que Welsh_Powell.
+    """
     n = len(sommets)
-    # Étape 1 : Calculer le degré de chaque sommet
-    degrees = []
-    for i in range(n):
-        deg = sum(1 for j in range(n) if matrice_adjacence[i][j] > 0)
-        degrees.append((i, deg))
-    
-    # Étape 2 : Trier par degré décroissant
-    degrees.sort(key=lambda x: x[1], reverse=True)
-    ordre_sommets = [idx for idx, _ in degrees]  # Ordre des indices
-    
-    # Tableau de couleurs (None = non coloré)
-    couleurs = [None] * n
-    used_colors = []
-    
-    # Tant qu'il reste des sommets non colorés
-    while any(c is None for c in couleurs):
-        # Générer une nouvelle couleur aléatoire non utilisée
-        current_color = (
-            random.randint(0, 255) / 255,
-            random.randint(0, 255) / 255,
-            random.randint(0, 255) / 255
-        )
-        while current_color in used_colors:
-            current_color = (
-                random.randint(0, 255) / 255,
-                random.randint(0, 255) / 255,
-                random.randint(0, 255) / 255
-            )
-        used_colors.append(current_color)
-        
-        # Parcourir tous les sommets dans l'ordre trié
-        for idx in ordre_sommets:
-            # Passer les sommets déjà colorés
-            if couleurs[idx] is not None:
-                continue
-                
-            # Vérifier les conflits avec les voisins
-            conflit = False
-            for voisin in range(n):
-                # Si les sommets sont adjacents ET le voisin a la couleur courante
-                if matrice_adjacence[idx][voisin] > 0 and couleurs[voisin] == current_color:
-                    conflit = True
-                    break
-                    
-            # Si pas de conflit, attribuer la couleur
-            if not conflit:
-                couleurs[idx] = current_color
-                
-    # Formatage du résultat comme dans la version originale
-    colored_sommets = [(i, couleurs[i]) for i in range(n)]
-    return colored_sommets
\ No newline at end of file
+    # Graphe vu comme non orienté : un arc dans un sens suffit à créer un conflit
+    voisins = [set() for _ in range(n)]
+    for i, ligne in enumerate(listes_adjacence(matrice_adjacence)):
+        for j, poids in ligne:
+            if poids > 0 and j != i:
+                voisins[i].add(j)
+                voisins[j].add(i)
+    degre = [len(v) for v in voisins]
+
+    identifiants = [-1] * n
+    interdites = [0] * n   # masque des couleurs présentes chez les voisins
+    saturation = [0] * n
+    compartiments = [[(-degre[i], i) for i in range(n)]]
+    heapq.heapify(compartiments[0])
+    plus_haute = 0
+
+    for _ in range(n):
+        # Sommet non coloré de saturation maximale (entrées obsolètes ignorées)
+        while True:
+            while not compartiments[plus_haute]:
+                plus_haute -= 1
+            _, v = heapq.heappop(compartiments[plus_haute])
+            if identifiants[v] < 0 and saturation[v] == plus_haute:
+                break
+
+        c = (~interdites[v] & (interdites[v] + 1)).bit_length() - 1
+        identifiants[v] = c
+        bit = 1 << c
+        for u in voisins[v]:
+            if identifiants[u] < 0 and not interdites[u] & bit:
+                interdites[u] |= bit
+                saturation[u] += 1
+                if saturation[u] == len(compartiments):
+                    compartiments.append([])
+                heapq.heappush(compartiments[saturation[u]], (-degre[u], u))
+                plus_haute = max(plus_haute, saturation[u])
+
+    return [(i, couleur(identifiants[i])) for i in range(n)]
+
+
+MOTEURS = ("welsh_powell", "dsatur")
+
+
+def colorier(sommets, matrice_adjacence, moteur="welsh_powell"):
+    # Point d'entrée commun des moteurs de coloration, choisis par leur nom
+    if moteur not in MOTEURS:
+        raise ValueError(f"Le moteur doit être l'un de {', '.join(MOTEURS)}")
+    if moteur == "dsatur":
+        return dsatur(sommets, matrice_adjacence)
+    return Welsh_Powell(sommets, matrice_adjacence)
@@ -1,34 +1,157 @@
+import numpy as np
+
+
+class MatriceCSR:
+    # Stockage compressé par lignes (CSR) : les voisins du sommet i sont
+    # indices[indptr[i]:indptr[i+1]] avec les poids correspondants dans weights
+
+    def __init__(self, n, indptr, indices, weights):
+        self.n = n
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def depuis_aretes(cls, n, aretes):
+        """Construit le CSR à partir d'un dictionnaire {(i, j): poids}
+
+        Comme pour la matrice dense, un poids 0 ou infini signifie absence d'arête.
+        """
+        aretes = {cle: poids for cle, poids in aretes.items() if poids != 0 and poids != float('inf')}
+        m = len(aretes)
+        src = np.fromiter((i for i, _ in aretes), dtype=np.int64, count=m)
+        dst = np.fromiter((j for _, j in aretes), dtype=np.int64, count=m)
+        weights = np.array(list(aretes.values())) if m else np.zeros(0)
+
+        # Tri par (ligne, colonne) pour parcourir les voisins dans l'ordre croissant
+        ordre = np.lexsort((dst, src))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(n, indptr, dst[ordre], weights[ordre])
+
+    @classmethod
+    def depuis_dense(cls, matrice):
+        aretes = {}
+        for i, ligne in enumerate(matrice):
+            for j, poids in enumerate(ligne):
+                if poids != 0 and poids != float('inf'):
+                    aretes[(i, j)] = poids
+        return cls.depuis_aretes(len(matrice), aretes)
+
+    def __len__(self):
+        return self.n
+
+    def nombre_aretes(self):
+        return len(self.indices)
+
+    def voisins(self, i):
+        debut, fin = self.indptr[i], self.indptr[i + 1]
+        return list(zip(self.indices[debut:fin].tolist(), self.weights[debut:fin].tolist()))
+
+    def to_dense(self):
+        matrice = [[0] * self.n for _ in range(self.n)]
+        for i in range(self.n):
+            for j, poids in self.voisins(i):
+                matrice[i][j] = poids
+        return matrice
+
+
+def listes_adjacence(matrice_adj):
+    # Listes de voisins [(j, poids), ...] par sommet, triées par indice croissant.
+    # O(V+E) pour un graphe CSR, O(V²) pour une matrice dense.
+    # Les cases à 0 ou à l'infini sont considérées comme absence d'arête.
+    if isinstance(matrice_adj, MatriceCSR):
+        return [matrice_adj.voisins(i) for i in range(len(matrice_adj))]
+    return [
+        [(j, poids) for j, poids in enumerate(ligne) if poids != 0 and poids != float('inf')]
+        for ligne in matrice_adj
+    ]
+
+
+def index_sommets(sommets):
+    # Dictionnaire nom -> indice (premier indice en cas de doublon, comme list.index)
+    index = {}
+    for i, sommet in enumerate(sommets):
+        index.setdefault(sommet, i)
+    return index
+
+
+def matrice_valide(matrice_adj, n):
+    if isinstance(matrice_adj, MatriceCSR):
+        return len(matrice_adj) == n
+    return len(matrice_adj) == n and all(len(row) == n for row in matrice_adj)
+
 
 class MatriceAdjacence:
 
-    def __init__(self,oriente=False):
+    def __init__(self,oriente=False, stockage="dense"):
+        # stockage="dense" : liste de listes n×n (petits graphes de cours)
+        # stockage="csr"   : tableaux NumPy indptr/indices/weights (grands graphes creux)
+        if stockage not in ("dense", "csr"):
+            raise ValueError("Le stockage doit être 'dense' ou 'csr'")
         self.sommets = []
+        self.index = {}  # nom du sommet -> indice, maintenu à chaque ajout
+        self.coordonnees = {}  # nom du sommet -> (x, y) ou (latitude, longitude), optionnel
         self.matrice = []
         self.oriente = oriente
-   
-    def ajouter_sommet(self, sommet):
-        if sommet not in self.sommets:
+        self.stockage = stockage
+        self._aretes = {}  # (i, j) -> poids, tampon du mode CSR
+        self._csr = None
+
+    def ajouter_sommet(self, sommet, coordonnees=None):
+        if coordonnees is not None:
+            self.coordonnees[sommet] = tuple(coordonnees)
+        if sommet not in self.index:
+            self.index[sommet] = len(self.sommets)
             self.sommets.append(sommet)
+            if self.stockage == "csr":
+                self._csr = None
+                return
             for ligne in self.matrice:
                 ligne.append(0) #ajouter uun nouvelle colone
             self.matrice.append([0] * len(self.sommets))   # Ajouter une nouvelle ligne
 
     def ajouter_arete(self, sommet1, sommet2, poids=1): #pour n Graphe non pondéré, le poid et toujour1, si non on peut specifier le poid
-        if sommet1 not in self.sommets:
+        if sommet1 not in self.index:
             self.ajouter_sommet(sommet1)
-        if sommet2 not in self.sommets:
+        if sommet2 not in self.index:
             self.ajouter_sommet(sommet2)
 
-        i = self.sommets.index(sommet1)
-        j = self.sommets.index(sommet2)
+        i = self.index[sommet1]
+        j = self.index[sommet2]
+
+        if self.stockage == "csr":
+            # Poids 0 ou infini : suppression de l'arête, comme dans la matrice dense
+            cles = [(i, j)] if self.oriente else [(i, j), (j, i)]
+            for cle in cles:
+                if poids == 0 or poids == float('inf'):
+                    self._aretes.pop(cle, None)
+                else:
+                    self._aretes[cle] = poids
+            self._csr = None  # le CSR sera reconstruit au prochain get_graphe
+            return
 
         self.matrice[i][j] = poids
         if not self.oriente:  # le cas de non orienter
             self.matrice[j][i] = poids
-    
+
+    def definir_coordonnees(self, sommet, x, y):
+        if sommet not in self.index:
+            self.ajouter_sommet(sommet)
+        self.coordonnees[sommet] = (x, y)
+
+    def get_csr(self):
+        if self.stockage == "dense":
+            return MatriceCSR.depuis_dense(self.matrice)
+        if self._csr is None:
+            self._csr = MatriceCSR.depuis_aretes(len(self.sommets), self._aretes)
+        return self._csr
+
     def get_graphe(self):
         return {
             "sommets": self.sommets,
-            "matrice": self.matrice,
-            "oriente": self.oriente
-        }
\ No newline at end of file
+            "index": self.index,
+            "matrice": self.get_csr() if self.stockage == "csr" else self.matrice,
+            "oriente": self.oriente,
+            "coordonnees": self.coordonnees
+        }
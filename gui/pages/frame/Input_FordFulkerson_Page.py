@@ -7,6 +7,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
 from Visualisation.graph.FordFulkersonPage import FordFulkersonPage
+from algorithms.graph.FordFulkerson import MOTEURS
 
 
 class InputFordFulkersonPage(tk.Frame):
@@ -72,6 +73,22 @@ class InputFordFulkersonPage(tk.Frame):
         )
         subtitle_label.pack(pady=(0, 10))
 
+        # Engine selector (edmonds_karp / dinic / push_relabel / auto)
+        moteur_frame = ttk.Frame(title_frame)
+        moteur_frame.pack(fill="x", pady=(0, 10))
+        ttk.Label(
+            moteur_frame, text="Moteur de calcul :", font=("Arial", 10)
+        ).pack(side="left", padx=(0, 5))
+        self.moteur = tk.StringVar(value="edmonds_karp")
+        moteur_combo = ttk.Combobox(
+            moteur_frame,
+            textvariable=self.moteur,
+            values=list(MOTEURS),
+            state="readonly",
+            width=14,
+        )
+        moteur_combo.pack(side="left")
+
         # Graph info display
         self.graph_info_frame = ttk.LabelFrame(
             left_panel, text="Informations du graphe"
@@ -455,7 +472,8 @@ class InputFordFulkersonPage(tk.Frame):
                 'sommets': nodes,
                 'matrice': matrice_adjacence,
                 'source': self.graph_data["source"],
-                'sink': self.graph_data["sink"]
+                'sink': self.graph_data["sink"],
+                'moteur': self.moteur.get()
             }
 
             # Display the results using FordFulkersonPage
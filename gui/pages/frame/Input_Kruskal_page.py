@@ -7,6 +7,8 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
 from Visualisation.graph.KruskalPage import KruskalPage
+from algorithms.graph.ArbreCouvrantDynamique import ArbreCouvrantDynamique
+from algorithms.graph.Kruskal import MOTEURS, arbre_couvrant_minimum, choisir_moteur
 
 class InputKruskal(tk.Frame):
     def __init__(self, parent, controller):
@@ -16,6 +18,8 @@ class InputKruskal(tk.Frame):
         self.matrice = []
         self.edges = []
         self.canvas_widget = None
+        self.arbre_dynamique = None  # arbre couvrant du dernier calcul, mis à jour par "Et si..."
+        self.moteur_utilise = None
 
         self.create_widgets()
         self.style_widgets()
@@ -77,6 +81,22 @@ class InputKruskal(tk.Frame):
             foreground="#2c3e50",
         )
         title_label.pack()
+
+        # Engine selector (kruskal / boruvka / prim_dense / prim_tas / auto)
+        moteur_frame = ttk.Frame(title_frame)
+        moteur_frame.pack(fill="x", pady=(10, 0))
+        ttk.Label(
+            moteur_frame, text="Moteur de calcul :", font=("Arial", 10)
+        ).pack(side="left", padx=(0, 5))
+        self.moteur = tk.StringVar(value="kruskal")
+        moteur_combo = ttk.Combobox(
+            moteur_frame,
+            textvariable=self.moteur,
+            values=list(MOTEURS),
+            state="readonly",
+            width=14,
+        )
+        moteur_combo.pack(side="left")
        
 
         # Graph info display
@@ -156,6 +176,15 @@ class InputKruskal(tk.Frame):
         )
         self.run_button.pack(side="left", padx=5, fill="x", expand=True)
 
+        # What-if action: insert one edge into the current tree without rerunning
+        self.what_if_button = ttk.Button(
+            left_panel,
+            text="Et si j'ajoute cette arête ?",
+            command=self.show_what_if_input,
+            state="disabled",
+        )
+        self.what_if_button.pack(fill="x", padx=5, pady=(10, 0))
+
         # Visualization panel
         self.viz_frame = ttk.LabelFrame(
             right_panel, text="Visualisation du graphe", style="TLabelframe"
@@ -404,8 +433,10 @@ class InputKruskal(tk.Frame):
         # Update graph info display
         self.update_graph_info()
 
-        # Disable run button
+        # Disable run and what-if buttons
         self.run_button.config(state="disabled")
+        self.what_if_button.config(state="disabled")
+        self.arbre_dynamique = None
 
         # Clear visualization
         if self.canvas_widget:
@@ -429,10 +460,16 @@ class InputKruskal(tk.Frame):
             return
 
         try:
-            self.update_status("Exécution de l'algorithme de Kruskal...")
+            # Moteur choisi ("auto" : Prim tableau ou Borůvka selon la densité du graphe)
+            moteur = self.moteur.get()
+            if moteur == "auto":
+                moteur = choisir_moteur(self.matrice)
+            self.update_status(f"Exécution de l'arbre couvrant minimal (moteur: {moteur})...")
 
-            # Exécute l'algorithme de Kruskal
-            mst_edges = kruskal(self.sommets, self.matrice)
+            mst_edges = arbre_couvrant_minimum(self.sommets, self.matrice, moteur)
+            self.arbre_dynamique = ArbreCouvrantDynamique(self.sommets, mst_edges)
+            self.moteur_utilise = moteur
+            self.what_if_button.config(state="normal")
 
             # Calcul du poids total
             total_weight = sum(edge[2] for edge in mst_edges)
@@ -443,18 +480,101 @@ class InputKruskal(tk.Frame):
                 'matrice': self.matrice,
                 'edges': self.edges,
                 'mst_edges': mst_edges,
-                'total_weight': total_weight
+                'total_weight': total_weight,
+                'moteur': moteur
             }
 
             # Afficher les résultats avec KruskalPage
             self.display_kruskal_results(data)
 
-            self.update_status(f"Algorithme terminé - Poids total: {total_weight}")
+            self.update_status(f"Algorithme terminé ({moteur}) - Poids total: {total_weight}")
 
         except Exception as e:
             messagebox.showerror("Erreur", f"Une erreur est survenue: {str(e)}")
             self.update_status("Erreur lors de l'exécution de l'algorithme")
 
+    def show_what_if_input(self):
+        """Boîte de dialogue : arête candidate à insérer dans l'arbre courant"""
+        dialog = tk.Toplevel(self)
+        dialog.title("Et si j'ajoute cette arête ?")
+        dialog.resizable(False, False)
+        dialog.configure(bg="#f0f0f0")
+
+        main_frame = ttk.Frame(dialog)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        entries = []
+        for row, label in enumerate(("Sommet 1", "Sommet 2", "Poids")):
+            ttk.Label(main_frame, text=label).grid(row=row, column=0, sticky="w", pady=3)
+            entry = ttk.Entry(main_frame)
+            entry.grid(row=row, column=1, sticky="ew", padx=5, pady=3)
+            entries.append(entry)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        ttk.Button(button_frame, text="Annuler", command=dialog.destroy).pack(
+            side="left", padx=5, fill="x", expand=True
+        )
+        ttk.Button(
+            button_frame,
+            text="Ajouter",
+            command=lambda: self.apply_what_if(dialog, *(e.get().strip() for e in entries)),
+            style="Accent.TButton",
+        ).pack(side="right", padx=5, fill="x", expand=True)
+
+    def apply_what_if(self, dialog, sommet1, sommet2, poids_str):
+        """Insère l'arête dans l'arbre couvrant courant et affiche le changement"""
+        try:
+            if sommet1 not in self.sommets or sommet2 not in self.sommets:
+                raise ValueError("Les deux sommets doivent exister dans le graphe")
+            if sommet1 == sommet2:
+                raise ValueError("Une boucle ne peut pas entrer dans l'arbre couvrant")
+            try:
+                poids = float(poids_str)
+            except ValueError:
+                raise ValueError("Le poids doit être un nombre")
+            if poids <= 0:
+                raise ValueError("Le poids doit être positif")
+        except ValueError as e:
+            messagebox.showerror("Erreur de saisie", str(e), parent=dialog)
+            return
+        dialog.destroy()
+
+        # Le graphe garde la plus légère des arêtes parallèles
+        i = self.sommets.index(sommet1)
+        j = self.sommets.index(sommet2)
+        if self.matrice[i][j] == 0 or poids < self.matrice[i][j]:
+            self.matrice[i][j] = poids
+            self.matrice[j][i] = poids
+            self.edges = [
+                e for e in self.edges if {e[0], e[1]} != {sommet1, sommet2}
+            ] + [(sommet1, sommet2, poids)]
+            self.update_graph_info()
+
+        ajoutee, retiree = self.arbre_dynamique.ajouter_arete(sommet1, sommet2, poids)
+        if not ajoutee:
+            message = f"L'arête {sommet1}-{sommet2} ({poids}) ne change pas l'arbre couvrant"
+        elif retiree is None:
+            message = f"L'arête {sommet1}-{sommet2} ({poids}) entre dans l'arbre couvrant"
+        else:
+            message = (
+                f"L'arête {sommet1}-{sommet2} ({poids}) remplace "
+                f"{retiree[0]}-{retiree[1]} ({retiree[2]})"
+            )
+
+        mst_edges = self.arbre_dynamique.aretes()
+        total_weight = self.arbre_dynamique.poids_total()
+        self.display_kruskal_results({
+            'sommets': self.sommets,
+            'matrice': self.matrice,
+            'edges': self.edges,
+            'mst_edges': mst_edges,
+            'total_weight': total_weight,
+            'moteur': self.moteur_utilise
+        })
+        messagebox.showinfo("Et si...", f"{message}\nNouveau poids total: {total_weight}")
+        self.update_status(f"{message} - Poids total: {total_weight}")
+
     def display_kruskal_results(self, data):
         """Affiche les résultats avec la classe KruskalPage"""
         # Effacer la visualisation précédente
@@ -610,43 +730,3 @@ class InputKruskal(tk.Frame):
         tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side="right", fill="y")
         tree.pack(fill=tk.BOTH, expand=True)
-
-def kruskal(nodes, matrix):
-    """Implementation of Kruskal's algorithm for MST"""
-    # Create list of all edges
-    edges = []
-    n = len(nodes)
-    for i in range(n):
-        for j in range(i + 1, n):  # Only upper triangle to avoid duplicates
-            if matrix[i][j] > 0:
-                edges.append((nodes[i], nodes[j], matrix[i][j]))
-
-    # Sort edges by weight
-    edges.sort(key=lambda x: x[2])
-
-    parent = {node: node for node in nodes}
-
-    def find(u):
-        while parent[u] != u:
-            parent[u] = parent[parent[u]]  # Path compression
-            u = parent[u]
-        return u
-
-    def union(u, v):
-        root_u = find(u)
-        root_v = find(v)
-        if root_u != root_v:
-            parent[root_v] = root_u
-
-    mst_edges = []
-
-    for edge in edges:
-        u, v, weight = edge
-        if find(u) != find(v):
-            union(u, v)
-            mst_edges.append(edge)
-
-    return mst_edges
-    return mst_edges
-
-
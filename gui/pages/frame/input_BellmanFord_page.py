@@ -7,6 +7,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 import networkx as nx
 from Visualisation.graph.BellmanFordPage import BellmanFordPage
+from algorithms.graph.BellmanFord import MODES
 
 class InputBellmanFordPage(tk.Frame):
     def __init__(self, parent, controller):
@@ -71,6 +72,22 @@ class InputBellmanFordPage(tk.Frame):
         )
         subtitle_label.pack(pady=(0, 10))
 
+        # Engine selector (standard / spfa / vectorise)
+        mode_frame = ttk.Frame(title_frame)
+        mode_frame.pack(fill="x", pady=(0, 10))
+        ttk.Label(
+            mode_frame, text="Moteur de calcul :", font=("Arial", 10)
+        ).pack(side="left", padx=(0, 5))
+        self.mode = tk.StringVar(value="standard")
+        mode_combo = ttk.Combobox(
+            mode_frame,
+            textvariable=self.mode,
+            values=list(MODES),
+            state="readonly",
+            width=10,
+        )
+        mode_combo.pack(side="left")
+
         # Graph info display
         self.graph_info_frame = ttk.LabelFrame(
             left_panel, text="Informations du graphe"
@@ -444,7 +461,8 @@ class InputBellmanFordPage(tk.Frame):
                 'sommets': nodes,
                 'matrice': matrice_adjacence,
                 'start': self.graph_data["start"],
-                'end': self.graph_data["end"]
+                'end': self.graph_data["end"],
+                'mode': self.mode.get()
             }
 
             # Display the results using BellmanFordPage
@@ -2,7 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import csv
-from algorithms.graph.Welsh_Powell import Welsh_Powell
+from algorithms.graph.Welsh_Powell import MOTEURS, colorier
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -74,6 +74,22 @@ class InputWelshPowell(tk.Frame):
         )
         subtitle_label.pack(pady=(0, 10))
 
+        # Engine selector (welsh_powell / dsatur)
+        moteur_frame = ttk.Frame(title_frame)
+        moteur_frame.pack(fill="x", pady=(0, 10))
+        ttk.Label(
+            moteur_frame, text="Moteur de calcul :", font=("Arial", 10)
+        ).pack(side="left", padx=(0, 5))
+        self.moteur = tk.StringVar(value="welsh_powell")
+        moteur_combo = ttk.Combobox(
+            moteur_frame,
+            textvariable=self.moteur,
+            values=list(MOTEURS),
+            state="readonly",
+            width=14,
+        )
+        moteur_combo.pack(side="left")
+
         # Graph info display
         self.graph_info_frame = ttk.LabelFrame(
             left_panel, text="Informations du graphe"
@@ -459,10 +475,11 @@ class InputWelshPowell(tk.Frame):
             return
 
         try:
-            self.update_status("Exécution de l'algorithme de Welsh-Powell...")
+            moteur = self.moteur.get()
+            self.update_status(f"Exécution de la coloration (moteur: {moteur})...")
 
-            # Exécuter l'algorithme de Welsh-Powell
-            colored_vertices = Welsh_Powell(self.sommets, self.matrice)
+            # Exécuter le moteur de coloration choisi
+            colored_vertices = colorier(self.sommets, self.matrice, moteur)
             
             # Calculer le nombre de couleurs utilisées
             num_colors = len(set(c[1] for c in colored_vertices))
@@ -472,7 +489,8 @@ class InputWelshPowell(tk.Frame):
                 'sommets': self.sommets,
                 'matrice': self.matrice,
                 'colored_vertices': colored_vertices,
-                'num_colors': num_colors
+                'num_colors': num_colors,
+                'moteur': moteur
             }
 
             # Afficher les résultats avec WelshPowellPage
@@ -7,6 +7,10 @@ import json
 import matplotlib.pyplot as plt
 import networkx as nx
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from algorithms.graph.AStar import HEURISTIQUES, a_etoile
+
+# Algorithmes proposés : Dijkstra, ou A* guidé par les coordonnées des sommets
+ALGORITHMES = ("dijkstra", "astar")
 
 
 class DijkstraImporter:
@@ -43,9 +47,14 @@ class DijkstraImporter:
                 with open(file_path, "r") as f:
                     data = json.load(f)
 
+                # Coordonnées optionnelles {sommet: [x, y]} (ou [latitude, longitude]) pour A*
+                coordonnees = {
+                    sommet: tuple(valeur) for sommet, valeur in data.get("coordonnees", {}).items()
+                }
+
                 if "sommets" in data and "matrice" in data:
                     # Use the provided format directly
-                    self.controller.set_graph_data(data["sommets"], data["matrice"])
+                    self.controller.set_graph_data(data["sommets"], data["matrice"], coordonnees)
                 elif "nodes" in data and "edges" in data:
                     # Original conversion code
                     nodes = data["nodes"]
@@ -57,7 +66,7 @@ class DijkstraImporter:
                         j = node_index[edge["to"]]
                         matrix[i][j] = edge["weight"]
 
-                    self.controller.set_graph_data(nodes, matrix)
+                    self.controller.set_graph_data(nodes, matrix, coordonnees)
                 else:
                     messagebox.showerror(
                         "Erreur",
@@ -136,9 +145,12 @@ class InputDijkstraPage(tk.Frame):
         self.sommets = []
         self.matrice = []
         self.edges = []  # Pour la saisie manuelle
+        self.coordonnees = {}  # sommet -> (x, y) ou (latitude, longitude), pour A*
         self.result = None  # Pour stocker le résultat
         self.start_node = tk.StringVar()
         self.end_node = tk.StringVar()
+        self.algorithme = tk.StringVar(value="dijkstra")
+        self.heuristique = tk.StringVar(value="euclidienne")
 
         # Apply modern styling
         self.style_widgets()
@@ -224,6 +236,23 @@ class InputDijkstraPage(tk.Frame):
         self.end_combo = ttk.Combobox(node_frame, textvariable=self.end_node)
         self.end_combo.pack(fill="x", pady=(0, 5))
 
+        # Algorithm selector (A* needs vertex coordinates from the JSON import)
+        ttk.Label(node_frame, text="Algorithme :").pack(anchor="w")
+        ttk.Combobox(
+            node_frame,
+            textvariable=self.algorithme,
+            values=ALGORITHMES,
+            state="readonly",
+        ).pack(fill="x", pady=(0, 5))
+
+        ttk.Label(node_frame, text="Heuristique A* :").pack(anchor="w")
+        ttk.Combobox(
+            node_frame,
+            textvariable=self.heuristique,
+            values=list(HEURISTIQUES),
+            state="readonly",
+        ).pack(fill="x", pady=(0, 5))
+
         # Info frame
         info_frame = ttk.LabelFrame(self.left_panel, text="Instructions")
         info_frame.pack(fill="x", pady=10)
@@ -234,7 +263,8 @@ class InputDijkstraPage(tk.Frame):
             "• Saisie manuelle : Entrez les données du graphe manuellement\n\n"
             "Format attendu :\n"
             "- Sommets : Liste de noms (ex: A, B, C, D)\n"
-            "- Matrice : Matrice d'adjacence avec les poids"
+            "- Matrice : Matrice d'adjacence avec les poids\n"
+            "- Coordonnées (JSON, pour A*) : {sommet: [x, y]}"
         )
         info_label = ttk.Label(info_frame, text=info_text, justify="left")
         info_label.pack(padx=5, pady=5)
@@ -318,10 +348,17 @@ class InputDijkstraPage(tk.Frame):
             style="Accent.TButton",
         ).pack(side="right", padx=5, fill="x", expand=True)
 
-    def set_graph_data(self, sommets, matrice):
+        ttk.Button(
+            self.action_buttons_frame,
+            text="Visualisation détaillée",
+            command=self.show_visualisation,
+        ).pack(side="right", padx=5, fill="x", expand=True)
+
+    def set_graph_data(self, sommets, matrice, coordonnees=None):
         """Méthode appelée par l'importer pour définir les données du graphe"""
         self.sommets = sommets
         self.matrice = matrice
+        self.coordonnees = coordonnees or {}
 
         # Update comboboxes
         self.start_combo["values"] = sommets
@@ -372,8 +409,26 @@ class InputDijkstraPage(tk.Frame):
             )
             return
 
-        # Run Dijkstra's algorithm
-        path, distance = self.dijkstra_algorithm(start, end)
+        # Run Dijkstra's algorithm, or A* (which also returns the explored vertices)
+        explores = set()
+        if self.algorithme.get() == "astar":
+            if not all(sommet in self.coordonnees for sommet in self.sommets):
+                messagebox.showwarning(
+                    "Attention",
+                    "A* nécessite les coordonnées de tous les sommets (clé 'coordonnees' du JSON)",
+                )
+                return
+            try:
+                path, explores = a_etoile(
+                    self.sommets, self.matrice, start, end,
+                    heuristique=self.heuristique.get(), coordonnees=self.coordonnees,
+                )
+            except ValueError as e:
+                messagebox.showerror("Erreur", str(e))
+                return
+            distance = self.calculate_path_distances(path)[end] if path else None
+        else:
+            path, distance = self.dijkstra_algorithm(start, end)
 
         if not path:
             self.update_results_panel(
@@ -401,10 +456,30 @@ class InputDijkstraPage(tk.Frame):
             f"De {start} à {end}:\n"
             f"Chemin: {' → '.join(path)}\n"
             f"Distance totale: {distance}\n\n"
-            f"Analyse complétée avec succès."
         )
-
-        self.update_results_panel(graph_info, result_text, path)
+        if self.algorithme.get() == "astar":
+            result_text += f"Sommets explorés par A*: {len(explores)}/{len(self.sommets)}\n"
+        result_text += "Analyse complétée avec succès."
+
+        self.update_results_panel(graph_info, result_text, path, explores)
+
+    def show_visualisation(self):
+        """Ouvre la page de visualisation Dijkstra / A* avec les paramètres choisis"""
+        n = len(self.sommets)
+        edges = [
+            (self.sommets[i], self.sommets[j], self.matrice[i][j])
+            for i in range(n) for j in range(n)
+            if self.matrice[i][j] > 0
+        ]
+        self.controller.show_visualisation("Dijkstra", {
+            "sommets": self.sommets,
+            "edges": edges,
+            "start": self.start_node.get(),
+            "end": self.end_node.get(),
+            "algorithme": self.algorithme.get(),
+            "heuristique": self.heuristique.get(),
+            "coordonnees": self.coordonnees,
+        })
 
     def dijkstra_algorithm(self, start, end):
         """Implémentation de l'algorithme de Dijkstra"""
@@ -457,7 +532,7 @@ class InputDijkstraPage(tk.Frame):
         else:
             return None, None
 
-    def update_results_panel(self, graph_info, result_text, path=None):
+    def update_results_panel(self, graph_info, result_text, path=None, explores=()):
         """Update the results panel with Dijkstra-specific visualization"""
         # Clear previous content
         for widget in self.graph_info_frame.winfo_children():
@@ -494,8 +569,15 @@ class InputDijkstraPage(tk.Frame):
                         self.sommets[i], self.sommets[j], weight=self.matrice[i][j]
                     )
 
-        # Node positioning
-        pos = nx.spring_layout(G, k=0.5, iterations=100, seed=42)
+        # Node positioning (vertex coordinates when every vertex has some)
+        if self.coordonnees and all(s in self.coordonnees for s in self.sommets):
+            if self.heuristique.get() == "haversine":
+                # (latitude, longitude) affiché en (x=longitude, y=latitude)
+                pos = {s: (self.coordonnees[s][1], self.coordonnees[s][0]) for s in self.sommets}
+            else:
+                pos = {s: self.coordonnees[s] for s in self.sommets}
+        else:
+            pos = nx.spring_layout(G, k=0.5, iterations=100, seed=42)
 
         # Draw all edges (gray)
         nx.draw_networkx_edges(
@@ -545,6 +627,8 @@ class InputDijkstraPage(tk.Frame):
         for node in G.nodes():
             if path and node in path:
                 node_colors.append("#4a6baf")  # Blue for path nodes
+            elif node in explores:
+                node_colors.append("#9bb1d9")  # Light blue for vertices explored by A*
             else:
                 node_colors.append("#2c3e50")  # Dark gray for other nodes
 
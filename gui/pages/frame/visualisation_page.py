@@ -72,6 +72,8 @@ class VisualisationFrame(tk.Frame):
                 page = WelshPowellPage(self.content_frame)
             elif algo_name == "Dijkstra":
                 page = DijkstraPage(self.content_frame)
+                if self.current_data:
+                    page.set_data(self.current_data)
             elif algo_name == "Simplex":
                 page = SimplexPage(self.content_frame, self.controller, self.current_data)
                 if self.current_data:
@@ -0,0 +1,60 @@
+import random
+import pytest
+from algorithms.graph.BellmanFord import MODES, CycleNegatifError, cycles_negatifs, distances_bellman_ford
+
+
+def deux_cycles(pont):
+    # a <-> b (poids -100) et c <-> d (poids -1), reliés par l'arête b -> c
+    matrice = [[0] * 4 for _ in range(4)]
+    matrice[0][1], matrice[1][0] = 1, -101
+    matrice[1][2] = pont
+    matrice[2][3], matrice[3][2] = 1, -2
+    return matrice
+
+
+def cycle_negatif_restant(matrice, sommets_gardes):
+    # Floyd-Warshall restreint aux sommets gardés : un cycle négatif y subsiste-t-il ?
+    n = len(matrice)
+    infini = float('inf')
+    d = [[0 if i == j else (matrice[i][j] or infini) for j in range(n)] for i in range(n)]
+    for k in sommets_gardes:
+        for i in sommets_gardes:
+            for j in sommets_gardes:
+                if d[i][k] + d[k][j] < d[i][j]:
+                    d[i][j] = d[i][k] + d[k][j]
+    return any(d[i][i] < 0 for i in sommets_gardes)
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("pont", [1, -50])
+def test_deux_cycles_disjoints(mode, pont):
+    cycles = cycles_negatifs(list("abcd"), deux_cycles(pont), mode)
+    assert sorted(cycles) == [["b", "a", "b"], ["d", "c", "d"]]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_deux_cycles_depuis_une_source(mode):
+    with pytest.raises(CycleNegatifError) as erreur:
+        distances_bellman_ford(list("abcd"), deux_cycles(1), "a", mode=mode)
+    assert sorted(erreur.value.cycles) == [["b", "a", "b"], ["d", "c", "d"]]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_cycles_disjoints_et_maximaux(mode):
+    # Les cycles renvoyés sont négatifs, disjoints, et le graphe privé de leurs
+    # sommets ne contient plus aucun cycle négatif
+    generateur = random.Random(1)
+    for _ in range(500):
+        n = generateur.randint(2, 8)
+        matrice = [
+            [generateur.randint(-6, 10) if i != j and generateur.random() < 0.3 else 0 for j in range(n)]
+            for i in range(n)
+        ]
+        sommets = [str(i) for i in range(n)]
+        cycles = [[int(v) for v in cycle] for cycle in cycles_negatifs(sommets, matrice, mode)]
+        pris = [v for cycle in cycles for v in cycle[:-1]]
+        assert len(pris) == len(set(pris))
+        for cycle in cycles:
+            assert all(matrice[u][v] != 0 for u, v in zip(cycle, cycle[1:]))
+            assert sum(matrice[u][v] for u, v in zip(cycle, cycle[1:])) < 0
+        assert not cycle_negatif_restant(matrice, [v for v in range(n) if v not in pris])
@@ -0,0 +1,109 @@
+import random
+import time
+import pytest
+from algorithms.graph.ContractionHierarchies import ContractionHierarchies
+from algorithms.graph.Djikstra import djikstra
+from data.graph_models import MatriceCSR
+
+
+def graphe_aleatoire(generateur, n, symetrique, poids):
+    matrice = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and generateur.random() < 0.25:
+                matrice[i][j] = poids(generateur)
+                if symetrique:
+                    matrice[j][i] = matrice[i][j]
+    return matrice
+
+
+def longueur(matrice, sommets, chemin):
+    # Longueur d'un chemin donné par noms de sommets, None s'il emprunte un arc absent
+    indices = [sommets.index(sommet) for sommet in chemin]
+    if any(matrice[u][v] == 0 for u, v in zip(indices, indices[1:])):
+        return None
+    return sum(matrice[u][v] for u, v in zip(indices, indices[1:]))
+
+
+def grille_csr(generateur, cote):
+    aretes = {}
+    for r in range(cote):
+        for c in range(cote):
+            i = r * cote + c
+            for j in ([i + 1] if c + 1 < cote else []) + ([i + cote] if r + 1 < cote else []):
+                aretes[(i, j)] = aretes[(j, i)] = generateur.randint(1, 10)
+    return MatriceCSR.depuis_aretes(cote * cote, aretes)
+
+
+@pytest.mark.parametrize("symetrique", [False, True])
+def test_chemins_de_meme_longueur_que_djikstra(symetrique):
+    # Poids dans {1, 2, 3} : beaucoup de plus courts chemins de même longueur
+    generateur = random.Random(5)
+    for _ in range(100):
+        n = generateur.randint(2, 25)
+        matrice = graphe_aleatoire(generateur, n, symetrique, lambda g: g.randint(1, 3))
+        sommets = [f"s{i}" for i in range(n)]
+        hierarchie = ContractionHierarchies.construire(sommets, matrice)
+        for _ in range(10):
+            debut, fin = generateur.choice(sommets), generateur.choice(sommets)
+            chemin = hierarchie.requete(debut, fin)
+            reference = djikstra(sommets, matrice, debut, fin)
+            if not reference:
+                assert chemin == []
+                continue
+            assert chemin[0] == debut and chemin[-1] == fin
+            assert longueur(matrice, sommets, chemin) == longueur(matrice, sommets, reference)
+            assert hierarchie.distance(debut, fin) == longueur(matrice, sommets, reference)
+
+
+def test_requete_plus_rapide_que_djikstra_sur_csr():
+    generateur = random.Random(3)
+    csr = grille_csr(generateur, 40)
+    sommets = list(range(len(csr)))
+    hierarchie = ContractionHierarchies.construire(sommets, csr)
+    requetes = [(generateur.choice(sommets), generateur.choice(sommets)) for _ in range(30)]
+
+    debut = time.perf_counter()
+    chemins = [hierarchie.requete(a, b) for a, b in requetes]
+    duree_hierarchie = time.perf_counter() - debut
+    debut = time.perf_counter()
+    references = [djikstra(sommets, csr, a, b) for a, b in requetes]
+    duree_djikstra = time.perf_counter() - debut
+
+    dense = csr.to_dense()
+    for chemin, reference in zip(chemins, references):
+        assert longueur(dense, sommets, chemin) == longueur(dense, sommets, reference)
+    assert duree_hierarchie < duree_djikstra
+
+
+@pytest.mark.parametrize("poids", [lambda g: g.randint(1, 9), lambda g: g.uniform(0.5, 9.5)])
+def test_sauvegarde_et_chargement(tmp_path, poids):
+    # Après un aller-retour sur disque, mêmes distances (et même type) et mêmes chemins
+    generateur = random.Random(7)
+    matrice = graphe_aleatoire(generateur, 30, True, poids)
+    sommets = [f"s{i}" for i in range(30)]
+    hierarchie = ContractionHierarchies.construire(sommets, matrice)
+    fichier = tmp_path / "hierarchie.npz"
+    hierarchie.sauvegarder(fichier)
+    rechargee = ContractionHierarchies.charger(fichier)
+    for debut in sommets[:10]:
+        for fin in sommets:
+            distance = hierarchie.distance(debut, fin)
+            assert rechargee.distance(debut, fin) == distance
+            assert type(rechargee.distance(debut, fin)) is type(distance)
+            assert rechargee.requete(debut, fin) == hierarchie.requete(debut, fin)
+
+
+def test_sauvegarde_avec_noms_tuples(tmp_path):
+    # Noms de sommets en coordonnées de grille : ils doivent rester des tuples
+    generateur = random.Random(11)
+    cote = 6
+    csr = grille_csr(generateur, cote)
+    sommets = [(r, c) for r in range(cote) for c in range(cote)]
+    hierarchie = ContractionHierarchies.construire(sommets, csr)
+    fichier = tmp_path / "grille.npz"
+    hierarchie.sauvegarder(fichier)
+    rechargee = ContractionHierarchies.charger(fichier)
+    assert rechargee.sommets == sommets
+    assert rechargee.requete((0, 0), (5, 5)) == hierarchie.requete((0, 0), (5, 5))
+    assert rechargee.distance((0, 0), (5, 5)) == hierarchie.distance((0, 0), (5, 5))
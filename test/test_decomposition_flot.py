@@ -0,0 +1,29 @@
+import random
+import pytest
+from algorithms.graph.DecompositionFlot import decomposer_flot
+from algorithms.graph.FordFulkerson import MOTEURS, flot_maximum
+
+
+def reseau_aleatoire(generateur, n):
+    return [
+        [generateur.randint(1, 9) if i != j and generateur.random() < 0.15 else 0 for j in range(n)]
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+def test_chemins_sur_arcs_existants(moteur):
+    # Le flot renvoyé est net : sa décomposition n'emprunte que des arcs de capacité > 0
+    generateur = random.Random(6)
+    for _ in range(300):
+        n = generateur.randint(2, 30)
+        matrice = reseau_aleatoire(generateur, n)
+        sommets = list(range(n))
+        source, puits = generateur.sample(sommets, 2)
+        max_flow, flow_matrix = flot_maximum(sommets, matrice, source, puits, moteur=moteur)
+        for u in range(n):
+            assert all(0 <= flow_matrix[u][v] <= matrice[u][v] for v in range(n))
+        chemins, cycles = decomposer_flot(sommets, flow_matrix, source, puits)
+        assert sum(quantite for _, quantite in chemins) == max_flow
+        for chemin, _ in chemins + cycles:
+            assert all(matrice[u][v] > 0 for u, v in zip(chemin, chemin[1:]))
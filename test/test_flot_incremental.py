@@ -0,0 +1,43 @@
+import random
+import pytest
+from algorithms.graph.FlotIncremental import flot_incremental
+from algorithms.graph.FordFulkerson import flot_maximum
+
+
+def reseau_aleatoire(generateur, n, densite):
+    return [
+        [generateur.randint(1, 20) if i != j and generateur.random() < densite else 0 for j in range(n)]
+        for i in range(n)
+    ]
+
+
+def flot_valide(capacites, flot, s, t):
+    n = len(capacites)
+    if any(not 0 <= flot[u][v] <= capacites[u][v] for u in range(n) for v in range(n)):
+        return False
+    return all(
+        sum(flot[u][v] for u in range(n)) == sum(flot[v][w] for w in range(n))
+        for v in range(n) if v not in (s, t)
+    )
+
+
+@pytest.mark.parametrize("moteur", ["edmonds_karp", "dinic", "push_relabel"])
+def test_meme_valeur_qu_un_recalcul(moteur):
+    # Hausses et baisses (jusqu'à la suppression) de capacités : même flot maximum
+    # qu'un calcul depuis zéro, et un flot valide sur les nouvelles capacités
+    generateur = random.Random(12)
+    for _ in range(100):
+        n = generateur.randint(2, 15)
+        matrice = reseau_aleatoire(generateur, n, 0.3)
+        sommets = [f"s{i}" for i in range(n)]
+        _, flot = flot_maximum(sommets, matrice, "s0", f"s{n - 1}", moteur)[:2]
+        modifications = [
+            (generateur.choice(sommets), generateur.choice(sommets), generateur.randint(-25, 15))
+            for _ in range(generateur.randint(1, 4))
+        ]
+        valeur, nouveau_flot, capacites = flot_incremental(
+            sommets, matrice, flot, modifications, "s0", f"s{n - 1}"
+        )
+        assert valeur == flot_maximum(sommets, capacites, "s0", f"s{n - 1}", "dinic")[0]
+        assert flot_valide(capacites, nouveau_flot, 0, n - 1)
+        assert valeur == sum(nouveau_flot[0]) - sum(ligne[0] for ligne in nouveau_flot)
@@ -0,0 +1,83 @@
+import random
+import pytest
+from algorithms.graph.BellmanFord import distances_bellman_ford
+from algorithms.graph.Djikstra import djikstra
+from algorithms.graph.FordFulkerson import MOTEURS as MOTEURS_FLOT, flot_maximum, fordFulkerson
+from algorithms.graph.Kruskal import MOTEURS as MOTEURS_ARBRE, arbre_couvrant_minimum, kruskal
+from algorithms.graph.Welsh_Powell import MOTEURS as MOTEURS_COLORATION, Welsh_Powell, colorier
+from data.graph_models import MatriceAdjacence, MatriceCSR
+
+
+def deux_stockages(oriente, aretes):
+    # Le même graphe en stockage dense et CSR
+    graphes = []
+    for stockage in ("dense", "csr"):
+        graphe = MatriceAdjacence(oriente=oriente, stockage=stockage)
+        for u, v, poids in aretes:
+            graphe.ajouter_arete(u, v, poids)
+        graphes.append(graphe.get_graphe())
+    return graphes
+
+
+def aretes_aleatoires(generateur, n, poids_max):
+    return [
+        (f"v{u}", f"v{v}", generateur.randint(0, poids_max))
+        for u in range(n) for v in range(n)
+        if u != v and generateur.random() < 0.3
+    ]
+
+
+@pytest.mark.parametrize("oriente", [False, True])
+def test_poids_nul_supprime_l_arete(oriente):
+    dense, csr = deux_stockages(oriente, [("a", "b", 1), ("b", "c", 1), ("a", "c", 5), ("a", "c", 0)])
+    assert csr["matrice"].to_dense() == dense["matrice"]
+    assert djikstra(csr["sommets"], csr["matrice"], "a", "c") == ["a", "b", "c"]
+    assert djikstra(dense["sommets"], dense["matrice"], "a", "c") == ["a", "b", "c"]
+
+
+def test_depuis_aretes_ignore_zero_et_infini():
+    csr = MatriceCSR.depuis_aretes(3, {(0, 1): 2, (1, 2): 0, (2, 0): float('inf')})
+    assert csr.nombre_aretes() == 1
+    assert csr.to_dense() == [[0, 2, 0], [0, 0, 0], [0, 0, 0]]
+
+
+@pytest.mark.parametrize("oriente", [False, True])
+def test_memes_resultats_en_dense_et_en_csr(oriente):
+    # Poids tirés dans [0, 5] : les poids nuls (suppressions) sont fréquents
+    generateur = random.Random(2)
+    for _ in range(100):
+        n = generateur.randint(2, 10)
+        dense, csr = deux_stockages(oriente, aretes_aleatoires(generateur, n, 5))
+        assert csr["matrice"].to_dense() == dense["matrice"]
+        sommets = dense["sommets"]
+        if len(sommets) < 2:
+            continue
+        debut, fin = sommets[0], sommets[-1]
+        assert djikstra(sommets, csr["matrice"], debut, fin) == djikstra(sommets, dense["matrice"], debut, fin)
+        assert distances_bellman_ford(sommets, csr["matrice"], debut) == distances_bellman_ford(sommets, dense["matrice"], debut)
+        assert fordFulkerson(sommets, csr["matrice"], debut, fin)[0] == fordFulkerson(sommets, dense["matrice"], debut, fin)[0]
+        if not oriente:
+            assert kruskal(sommets, csr["matrice"]) == kruskal(sommets, dense["matrice"])
+            assert Welsh_Powell(sommets, csr["matrice"]) == Welsh_Powell(sommets, dense["matrice"])
+
+
+@pytest.mark.parametrize("oriente", [False, True])
+def test_moteurs_identiques_en_dense_et_en_csr(oriente):
+    # Chaque moteur donne le même résultat quel que soit le stockage
+    generateur = random.Random(3)
+    for _ in range(50):
+        n = generateur.randint(2, 15)
+        dense, csr = deux_stockages(oriente, aretes_aleatoires(generateur, n, 5))
+        sommets = dense["sommets"]
+        if len(sommets) < 2:
+            continue
+        debut, fin = sommets[0], sommets[-1]
+        for moteur in MOTEURS_FLOT:
+            assert (flot_maximum(sommets, csr["matrice"], debut, fin, moteur)[0]
+                    == flot_maximum(sommets, dense["matrice"], debut, fin, moteur)[0])
+        if not oriente:
+            for moteur in MOTEURS_ARBRE:
+                assert (arbre_couvrant_minimum(sommets, csr["matrice"], moteur)
+                        == arbre_couvrant_minimum(sommets, dense["matrice"], moteur))
+            for moteur in MOTEURS_COLORATION:
+                assert colorier(sommets, csr["matrice"], moteur) == colorier(sommets, dense["matrice"], moteur)
@@ -0,0 +1,57 @@
+import random
+import numpy as np
+import pytest
+import algorithms.graph.Johnson as Johnson
+from algorithms.graph.BellmanFord import distances_bellman_ford
+from algorithms.graph.Johnson import chemin_johnson, johnson
+
+
+def graphe_sans_cycle_negatif(generateur, n):
+    # Poids w + p[i] - p[j] avec w > 0 : des poids négatifs, mais aucun cycle négatif
+    potentiels = [generateur.randint(0, 8) for _ in range(n)]
+    return [
+        [
+            generateur.randint(1, 6) + potentiels[i] - potentiels[j] or 1
+            if i != j and generateur.random() < 0.3 else 0
+            for j in range(n)
+        ]
+        for i in range(n)
+    ]
+
+
+def verifier(sommets, matrice, distances, predecesseurs):
+    for s in sommets:
+        attendues, _ = distances_bellman_ford(sommets, matrice, s)
+        assert distances[s].tolist() == [float(d) for d in attendues]
+        for v in sommets:
+            chemin = chemin_johnson(sommets, predecesseurs, s, v)
+            if distances[s][v] == np.inf:
+                assert chemin == []
+            else:
+                assert chemin[0] == s and chemin[-1] == v
+                assert sum(matrice[a][b] for a, b in zip(chemin, chemin[1:])) == distances[s][v]
+
+
+@pytest.mark.parametrize("processus", [1, 2])
+def test_sequentiel_et_parallele(processus):
+    generateur = random.Random(8)
+    n = 25
+    matrice = graphe_sans_cycle_negatif(generateur, n)
+    sommets = list(range(n))
+    distances, predecesseurs = johnson(sommets, matrice, processus=processus)
+    verifier(sommets, matrice, distances, predecesseurs)
+
+
+def test_petit_graphe_sans_processus(monkeypatch):
+    # Par défaut, un graphe sous SEUIL_PARALLELE ne démarre aucun processus
+    def interdit(*args, **kwargs):
+        raise AssertionError("pool de processus démarré pour un petit graphe")
+
+    monkeypatch.setattr(Johnson, "ProcessPoolExecutor", interdit)
+    monkeypatch.setattr(Johnson.os, "cpu_count", lambda: 8)
+    generateur = random.Random(9)
+    n = 40
+    matrice = graphe_sans_cycle_negatif(generateur, n)
+    sommets = list(range(n))
+    distances, predecesseurs = johnson(sommets, matrice)
+    verifier(sommets, matrice, distances, predecesseurs)
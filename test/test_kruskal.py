@@ -0,0 +1,105 @@
+import random
+import pytest
+from algorithms.graph.Kruskal import MOTEURS, arbre_couvrant_minimum, kruskal, kruskal_externe
+
+
+def graphe_aleatoire(generateur, n, densite, poids):
+    matrice = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if generateur.random() < densite:
+                matrice[i][j] = matrice[j][i] = poids(generateur)
+    return matrice
+
+
+def aretes(arbre):
+    return {frozenset((u, v)) for u, v, _ in arbre}
+
+
+def sans_cycle(sommets, arbre):
+    parent = {sommet: sommet for sommet in sommets}
+
+    def racine(sommet):
+        while parent[sommet] != sommet:
+            sommet = parent[sommet]
+        return sommet
+
+    for u, v, _ in arbre:
+        if racine(u) == racine(v):
+            return False
+        parent[racine(u)] = racine(v)
+    return True
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+def test_poids_distincts_meme_arbre_que_kruskal(moteur):
+    # Poids tous distincts : l'arbre couvrant minimum est unique
+    generateur = random.Random(2)
+    for _ in range(100):
+        n = generateur.randint(1, 30)
+        densite = generateur.choice([0.1, 0.3, 0.8])
+        tirage = iter(generateur.sample(range(1, 10 * n * n + 2), n * n))
+        matrice = graphe_aleatoire(generateur, n, densite, lambda g: next(tirage))
+        sommets = [f"s{i}" for i in range(n)]
+        reference = kruskal(sommets, matrice)
+        arbre = arbre_couvrant_minimum(sommets, matrice, moteur)
+        assert aretes(arbre) == aretes(reference)
+        assert sum(p for _, _, p in arbre) == sum(p for _, _, p in reference)
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+def test_poids_egaux_meme_poids_que_kruskal(moteur):
+    # Poids dans {1, 2, 3} : plusieurs arbres minimums, tous de mêmes poids triés
+    generateur = random.Random(4)
+    for _ in range(100):
+        n = generateur.randint(1, 30)
+        densite = generateur.choice([0.1, 0.3, 0.8])
+        matrice = graphe_aleatoire(generateur, n, densite, lambda g: g.randint(1, 3))
+        sommets = [f"s{i}" for i in range(n)]
+        reference = kruskal(sommets, matrice)
+        arbre = arbre_couvrant_minimum(sommets, matrice, moteur)
+        assert len(arbre) == len(reference) and sans_cycle(sommets, arbre)
+        assert all(matrice[int(u[1:])][int(v[1:])] == p for u, v, p in arbre)
+        assert sorted(p for _, _, p in arbre) == sorted(p for _, _, p in reference)
+
+
+def test_mode_tableaux_meme_arbre_que_kruskal():
+    generateur = random.Random(6)
+    for _ in range(50):
+        n = generateur.randint(1, 30)
+        matrice = graphe_aleatoire(generateur, n, 0.3, lambda g: g.randint(1, 3))
+        sommets = [f"s{i}" for i in range(n)]
+        arbre = kruskal(sommets, matrice, mode="tableaux")
+        assert sans_cycle(sommets, arbre)
+        assert sorted(p for _, _, p in arbre) == sorted(p for _, _, p in kruskal(sommets, matrice))
+
+
+def ecrire_csv(chemin, sommets, matrice):
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        for i in range(len(matrice)):
+            for j in range(i + 1, len(matrice)):
+                if matrice[i][j]:
+                    fichier.write(f"{sommets[i]},{sommets[j]},{matrice[i][j]}\n")
+
+
+@pytest.mark.parametrize("taille_bloc", [1, 7, 1_000_000])
+def test_kruskal_externe_meme_poids_que_kruskal(tmp_path, taille_bloc):
+    # Blocs plus petits que le nombre d'arêtes : plusieurs fichiers triés à fusionner
+    generateur = random.Random(10)
+    for essai in range(30):
+        n = generateur.randint(2, 25)
+        matrice = graphe_aleatoire(generateur, n, 0.4, lambda g: g.randint(1, 5))
+        sommets = [f"s{i}" for i in range(n)]
+        chemin = tmp_path / f"aretes_{essai}.csv"
+        ecrire_csv(chemin, sommets, matrice)
+        reference = kruskal(sommets, matrice)
+        arbre = kruskal_externe(chemin, taille_bloc=taille_bloc)
+        assert len(arbre) == len(reference)
+        assert sorted(p for _, _, p in arbre) == sorted(p for _, _, p in reference)
+        assert all(type(p) is int for _, _, p in arbre)
+
+
+def test_kruskal_externe_poids_reels(tmp_path):
+    chemin = tmp_path / "aretes.csv"
+    chemin.write_text("a,b,1.5\nb,c,2\na,c,4\n", encoding="utf-8")
+    assert kruskal_externe(chemin, taille_bloc=1) == [("a", "b", 1.5), ("b", "c", 2.0)]
@@ -0,0 +1,21 @@
+import random
+from algorithms.graph.Dinic import dinic
+from algorithms.graph.PushRelabel import push_relabel
+
+
+def test_meme_flot_maximum_que_dinic():
+    generateur = random.Random(4)
+    for _ in range(500):
+        n = generateur.randint(2, 14)
+        matrice = [
+            [generateur.randint(1, 9) if i != j and generateur.random() < 0.35 else 0 for j in range(n)]
+            for i in range(n)
+        ]
+        sommets = list(range(n))
+        source, puits = generateur.sample(sommets, 2)
+        max_flow, flot = push_relabel(sommets, matrice, source, puits)
+        assert max_flow == dinic(sommets, matrice, source, puits)[0]
+        for u in range(n):
+            assert all(0 <= flot[u][v] <= matrice[u][v] for v in range(n))
+            if u not in (source, puits):
+                assert sum(flot[v][u] for v in range(n)) == sum(flot[u][v] for v in range(n))
@@ -0,0 +1,65 @@
+import random
+import pytest
+from algorithms.graph.Welsh_Powell import MOTEURS, PALETTE, Welsh_Powell, colorier, couleur
+
+
+def welsh_powell_par_classes(matrice):
+    # Version d'origine : une couleur à la fois, dans l'ordre des degrés décroissants
+    n = len(matrice)
+    ordre = sorted(range(n), key=lambda i: sum(1 for j in range(n) if matrice[i][j] > 0), reverse=True)
+    identifiants = [None] * n
+    courante = 0
+    while any(c is None for c in identifiants):
+        for idx in ordre:
+            if identifiants[idx] is None and not any(
+                matrice[idx][j] > 0 and identifiants[j] == courante for j in range(n)
+            ):
+                identifiants[idx] = courante
+        courante += 1
+    return identifiants
+
+
+def graphe_aleatoire(generateur, n, densite):
+    matrice = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if generateur.random() < densite:
+                matrice[i][j] = matrice[j][i] = generateur.randint(1, 9)
+    return matrice
+
+
+def coloration_valide(matrice, coloration):
+    couleurs = dict(coloration)
+    n = len(matrice)
+    return all(couleurs[i] != couleurs[j] for i in range(n) for j in range(n) if i != j and matrice[i][j] > 0)
+
+
+def test_meme_nombre_de_couleurs_que_l_original():
+    generateur = random.Random(8)
+    for _ in range(200):
+        n = generateur.randint(1, 40)
+        matrice = graphe_aleatoire(generateur, n, generateur.choice([0.1, 0.3, 0.7]))
+        sommets = [f"s{i}" for i in range(n)]
+        coloration = Welsh_Powell(sommets, matrice)
+        assert [i for i, _ in coloration] == list(range(n))
+        assert coloration_valide(matrice, coloration)
+        reference = welsh_powell_par_classes(matrice)
+        assert len({c for _, c in coloration}) == len(set(reference))
+        assert [c for _, c in coloration] == [couleur(k) for k in reference]
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+def test_coloration_valide_et_reproductible(moteur):
+    generateur = random.Random(9)
+    for _ in range(100):
+        n = generateur.randint(1, 40)
+        matrice = graphe_aleatoire(generateur, n, 0.3)
+        sommets = [f"s{i}" for i in range(n)]
+        coloration = colorier(sommets, matrice, moteur)
+        assert coloration_valide(matrice, coloration)
+        assert colorier(sommets, matrice, moteur) == coloration
+
+
+def test_couleurs_distinctes_au_dela_de_la_palette():
+    teintes = [couleur(k) for k in range(len(PALETTE) + 40)]
+    assert len(set(teintes)) == len(teintes)